@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+#
+# This script measures the NetboxClient `paginate` throughput for different
+# connection pool settings, using a local stand-in for the Netbox API server.
+# The stand-in server returns pages of interface records after a fixed
+# delay, to model the server processing time, and supports HTTP/1.1
+# keep-alive.  It does not support HTTP/2.
+#
+# Usage:
+#   python bench-paginate.py [--records N] [--delay SECONDS] [--prefetch N]
+#
+
+import io
+import os
+import sys
+import json
+import time
+import asyncio
+import argparse
+from urllib.parse import urlsplit, parse_qs
+
+import toml
+
+# the ipf_netbox package requires the IP Fabric environment variables, which
+# are not used by the benchmark.
+
+for _var in ("IPF_ADDR", "IPF_USERNAME", "IPF_PASSWORD"):
+    os.environ.setdefault(_var, "unused")
+
+from ipf_netbox.config import load_config_file  # noqa: E402
+from ipf_netbox.netbox.source import NetboxClient  # noqa: E402
+
+# (label, [sources.netbox.http] settings) for each benchmark run.
+
+POOL_SETTINGS = [
+    ("no keepalive, 10 conns", dict(max_connections=10, max_keepalive_connections=0)),
+    ("keepalive, 10 conns", dict(max_connections=10)),
+    ("no keepalive, 100 conns", dict(max_connections=100, max_keepalive_connections=0)),
+    ("keepalive, 100 conns", dict(max_connections=100)),
+]
+
+
+# -----------------------------------------------------------------------------
+#
+#                              Stand-in Server
+#
+# -----------------------------------------------------------------------------
+
+
+class StandInServer(object):
+    def __init__(self, n_records, delay):
+        self.records = [
+            dict(
+                id=rec_id,
+                name=f"Ethernet{rec_id % 48}",
+                description=f"interface {rec_id}",
+                device=dict(id=rec_id // 48, name=f"switch{rec_id // 48}"),
+            )
+            for rec_id in range(1, n_records + 1)
+        ]
+        self.delay = delay
+        self.connections = 0
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+
+                headers = dict()
+                while (line := await reader.readline()) not in (b"\r\n", b""):
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                _method, target, _version = request_line.decode().split()
+                query = parse_qs(urlsplit(target).query)
+                offset = int(query.get("offset", ["0"])[0])
+                limit = min(int(query.get("limit", ["50"])[0]), 1000)
+
+                await asyncio.sleep(self.delay)
+
+                body = json.dumps(
+                    dict(
+                        count=len(self.records),
+                        results=self.records[offset : offset + limit],
+                    )
+                ).encode()
+
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Type: application/json\r\n"
+                    b"API-Version: 3.7\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+
+                if headers.get("connection") == "close":
+                    break
+
+        except ConnectionError:
+            pass
+
+        finally:
+            writer.close()
+
+
+# -----------------------------------------------------------------------------
+#
+#                              Benchmark
+#
+# -----------------------------------------------------------------------------
+
+
+async def bench(server, port, http_config, prefetch):
+    cfg = dict(
+        defaults=dict(domain_names=[]),
+        sources=dict(netbox=dict(http=http_config)),
+    )
+    load_config_file(filepath=io.StringIO(toml.dumps(cfg)))
+
+    os.environ["NETBOX_ADDR"] = f"http://127.0.0.1:{port}"
+    os.environ.setdefault("NETBOX_TOKEN", "bench")
+
+    server.connections = 0
+
+    async with NetboxClient() as client:
+        start = time.perf_counter()
+        records = await client.paginate(
+            "/dcim/interfaces/", page_sz=100, prefetch=prefetch
+        )
+        elapsed = time.perf_counter() - start
+
+    return len(records), elapsed, server.connections
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--delay", type=float, default=0.005)
+    parser.add_argument("--prefetch", type=int, default=50)
+    args = parser.parse_args()
+
+    server = StandInServer(args.records, args.delay)
+    listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+    port = listener.sockets[0].getsockname()[1]
+
+    print(
+        f"paginate {args.records} records, page size 100, prefetch {args.prefetch},"
+        f" server delay {args.delay * 1000:.0f}ms\n"
+    )
+
+    async with listener:
+        for label, http_config in POOL_SETTINGS:
+            count, elapsed, conns = await bench(
+                server, port, http_config, args.prefetch
+            )
+            print(
+                f"{label:<28} {elapsed:6.2f}s  {count / elapsed:9.0f} rec/s"
+                f"  {conns:5} connections"
+            )
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
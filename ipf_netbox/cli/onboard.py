@@ -1,6 +1,7 @@
 import asyncio
 
 from ipf_netbox.cli.__main__ import cli
+from ipf_netbox.session import Session
 from ipf_netbox.tasks.devices import ensure_devices
 from ipf_netbox.tasks.ipaddrs import ensure_ipaddrs
 from ipf_netbox.tasks.interfaces import ensure_interfaces
@@ -19,6 +20,12 @@ def cli_onboard(**params):
     """
 
     async def onboard_devices():
+        # the tasks share the session sources, and therefore the API clients.
+
+        async with Session():
+            await _onboard_devices()
+
+    async def _onboard_devices():
         ipf_col_devs = await ensure_devices(**params)
         ipf_dev_list = [rec["hostname"] for rec in ipf_col_devs.inventory.values()]
 
@@ -0,0 +1,89 @@
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Any, Callable, Union
+import json
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["loads", "dumps", "projected_decoder", "CODEC_NAME", "JSON_HEADERS"]
+
+
+# -----------------------------------------------------------------------------
+#
+#                              CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# The JSON codec used for the API request and response bodies.  The fastest
+# available library is used: orjson, then msgspec, and otherwise the standard
+# library json module.
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+try:
+    import orjson
+
+    CODEC_NAME = "orjson"
+
+    def loads(data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+except ImportError:
+    try:
+        import msgspec
+
+        CODEC_NAME = "msgspec"
+        _decoder = msgspec.json.Decoder()
+        _encoder = msgspec.json.Encoder()
+
+        def loads(data: Union[bytes, str]) -> Any:
+            # raise ValueError on invalid JSON, as json and orjson do.
+            try:
+                return _decoder.decode(data)
+            except msgspec.DecodeError as exc:
+                raise ValueError(str(exc)) from exc
+
+        def dumps(obj: Any) -> bytes:
+            return _encoder.encode(obj)
+
+    except ImportError:
+        CODEC_NAME = "json"
+
+        def loads(data: Union[bytes, str]) -> Any:
+            return json.loads(data)
+
+        def dumps(obj: Any) -> bytes:
+            return json.dumps(obj).encode()
+
+
+def projected_decoder(schema: Any) -> Callable[[Union[bytes, str]], Any]:
+    """
+    Return a function that decodes JSON into the `schema` type, for example a
+    TypedDict, so that the fields not in the schema are skipped by the parser
+    rather than decoded and later discarded.  This requires the msgspec
+    package, installed with the "fast-json" or "msgspec" extra; otherwise the
+    function returned is `loads` and the schema is not applied.  The function
+    raises ValueError if the JSON does not match the schema.
+    """
+    try:
+        import msgspec
+
+    except ImportError:
+        return loads
+
+    decoder = msgspec.json.Decoder(schema)
+
+    def _decode(data: Union[bytes, str]) -> Any:
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as exc:
+            raise ValueError(str(exc)) from exc
+
+    return _decode
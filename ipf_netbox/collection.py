@@ -1,4 +1,4 @@
-from typing import List, Dict, Any, Callable, Tuple, Optional, Type
+from typing import List, Dict, Any, Callable, Tuple, Optional, Type, AsyncIterator
 from abc import ABC
 from operator import itemgetter
 
@@ -80,9 +80,10 @@ class Collector(ABC, CollectionMixin):
         with_inventory=None,
     ):
         if not len(self.source_records):
-            get_logger().info(
-                f"Collection {self.name}:{self.source_class.__name__}: inventory empty."
-            )
+            if not self.inventory:
+                get_logger().info(
+                    f"Collection {self.name}:{self.source_class.__name__}: inventory empty."
+                )
             return
 
         with_filter = with_filter if with_filter else lambda x: True
@@ -94,17 +95,32 @@ class Collector(ABC, CollectionMixin):
             self.inventory.clear()
 
         for rec in with_inventory or self.source_records:
-            try:
-                fp = self.fingerprint(rec)
-                if not with_filter(fp):
-                    continue
+            self._make_key(rec, kf_getter, with_filter, with_translate)
+
+    async def stream_keys(self, records: AsyncIterator[Dict]):
+        """
+        Fingerprint and key the records as they are fetched, using the
+        KEY_FIELDS, rather than storing them in `source_records` first; so that
+        only the keyed records are kept in memory.  The inventory is added to,
+        so the Caller can stream more than one fetch into the collection.
+        """
+        kf_getter = itemgetter(*self.KEY_FIELDS)
+
+        async for rec in records:
+            self._make_key(rec, kf_getter, lambda x: True, lambda x: x)
+
+    def _make_key(self, rec, kf_getter, with_filter, with_translate):
+        try:
+            fp = self.fingerprint(rec)
+            if not with_filter(fp):
+                return
 
-            except Exception as exc:
-                raise RuntimeError("Fingerprint failed", rec, exc)
+        except Exception as exc:
+            raise RuntimeError("Fingerprint failed", rec, exc)
 
-            as_key = with_translate(kf_getter(fp))
-            self.inventory[as_key] = fp
-            self.source_record_keys[as_key] = rec
+        as_key = with_translate(kf_getter(fp))
+        self.inventory[as_key] = fp
+        self.source_record_keys[as_key] = rec
 
     @classmethod
     def get_collection(cls, source, name) -> "Collector":
@@ -131,7 +147,8 @@ class Collector(ABC, CollectionMixin):
         return c_cls(source=source)
 
     def __len__(self):
-        return len(self.source_records)
+        # a collection keyed by `stream_keys` has no source_records.
+        return len(self.source_records) or len(self.source_record_keys)
 
 
 get_collection = Collector.get_collection
@@ -1,13 +1,32 @@
-from typing import TextIO
+from typing import TextIO, Optional
 from contextvars import ContextVar
+from pathlib import Path
 
 import toml
 
 from pydantic import ValidationError
 from pydantic_env import config_validation_errors
-from .config_models import ConfigModel
+from .config_models import ConfigModel, SourceModel, RetryModel, ConcurrencyModel
+from .config_models import BudgetModel, RefDataModel, IncrementalModel, GraphQLModel
+from .config_models import HttpModel, GetCacheModel, TableCacheModel
 
-__all__ = ["get_config", "load_config_file", "ConfigModel"]
+__all__ = [
+    "get_config",
+    "get_source_config",
+    "get_cache_dir",
+    "load_config_file",
+    "ConfigModel",
+    "SourceModel",
+    "RetryModel",
+    "ConcurrencyModel",
+    "BudgetModel",
+    "RefDataModel",
+    "IncrementalModel",
+    "GraphQLModel",
+    "HttpModel",
+    "GetCacheModel",
+    "TableCacheModel",
+]
 
 g_config = ContextVar("config")
 
@@ -16,6 +35,39 @@ def get_config() -> ConfigModel:
     return g_config.get()
 
 
+def get_source_config(name: str) -> SourceModel:
+    """
+    Return the `sources` configuration for the given source name.  If the
+    config file does not define the source, or no config file is loaded, then
+    return the default settings.
+    """
+    try:
+        sources = get_config().sources or {}
+    except LookupError:
+        sources = {}
+
+    return sources.get(name) or SourceModel()
+
+
+def get_cache_dir(*parts: str) -> Optional[Path]:
+    """
+    Return the cache directory path for the given sub-directory parts,
+    creating it if needed.  If the config does not define a cache directory
+    then return None, meaning that caching to disk is disabled.
+    """
+    try:
+        cache_cfg = get_config().cache
+    except LookupError:
+        return None
+
+    if not (cache_cfg and cache_cfg.directory):
+        return None
+
+    cache_dir = Path(cache_cfg.directory).expanduser().joinpath(*parts)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
 def load_config_file(filepath: TextIO):
     try:
         config_obj = ConfigModel.parse_obj(toml.load(filepath))
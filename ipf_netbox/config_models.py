@@ -1,6 +1,7 @@
 from typing import Optional, List, Dict
+from importlib.util import find_spec
 
-
+from pydantic import validator
 from pydantic_env.models import NoExtraBaseModel
 
 
@@ -8,12 +9,85 @@ class DefaultsModel(NoExtraBaseModel):
     domain_names: Optional[List[str]]
 
 
+class RetryModel(NoExtraBaseModel):
+    max_retries: int = 5
+    backoff: float = 0.5
+    backoff_max: float = 30.0
+
+
+class ConcurrencyModel(NoExtraBaseModel):
+    initial: int = 20
+    minimum: int = 2
+    maximum: int = 200
+    decrease: float = 0.5
+    latency_factor: float = 3.0
+
+
+class BudgetModel(NoExtraBaseModel):
+    path: str = "*"
+    methods: Optional[List[str]]
+    limit: int
+
+
+class RefDataModel(NoExtraBaseModel):
+    ttl: int = 3600
+
+
+class IncrementalModel(NoExtraBaseModel):
+    reconcile: int = 86400
+
+
+class GraphQLModel(NoExtraBaseModel):
+    enabled: bool = False
+    url: Optional[str]
+    batch_size: int = 50
+    limit: int = 4
+
+
+class HttpModel(NoExtraBaseModel):
+    max_connections: Optional[int]
+    max_keepalive_connections: Optional[int]
+    keepalive_expiry: float = 5.0
+    http2: bool = False
+
+    @validator("http2")
+    def _h2_installed(cls, value):
+        if value and find_spec("h2") is None:
+            raise ValueError('requires the "h2" package: pip install ipf-netbox[http2]')
+        return value
+
+
+class GetCacheModel(NoExtraBaseModel):
+    enabled: bool = False
+    ttl: float = 300.0
+    max_entries: int = 5000
+
+
+class TableCacheModel(NoExtraBaseModel):
+    enabled: bool = True
+    max_snapshots: int = 3
+
+
 class SourceModel(NoExtraBaseModel):
     limit: Optional[List[str]]
     exclude: Optional[List[str]]
+    retries: Optional[RetryModel]
+    concurrency: Optional[ConcurrencyModel]
+    budgets: Optional[List[BudgetModel]]
+    refdata: Optional[RefDataModel]
+    incremental: Optional[IncrementalModel]
+    graphql: Optional[GraphQLModel]
+    http: Optional[HttpModel]
+    get_cache: Optional[GetCacheModel]
+    table_cache: Optional[TableCacheModel]
+
+
+class CacheModel(NoExtraBaseModel):
+    directory: Optional[str]
 
 
 class ConfigModel(NoExtraBaseModel):
     defaults: DefaultsModel
     sources: Optional[Dict[str, SourceModel]]
+    cache: Optional[CacheModel]
     maps: Optional[Dict]
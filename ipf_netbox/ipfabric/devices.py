@@ -4,13 +4,12 @@
 
 from typing import Dict
 
-from aioipfabric.filters import parse_filter
-
 # -----------------------------------------------------------------------------
 # Private Imports
 # -----------------------------------------------------------------------------
 
 from ipf_netbox.collection import Collector
+from ipf_netbox.ipfabric.filters import ipf_filters
 from ipf_netbox.collections.devices import DeviceCollection
 from ipf_netbox.ipfabric.source import IPFabricSource
 from ipf_netbox.mappings import normalize_hostname
@@ -32,11 +31,27 @@ __all__ = ["IPFabricDeviceCollection"]
 class IPFabricDeviceCollection(Collector, DeviceCollection):
     source_class = IPFabricSource
 
+    # the device table columns used by `fingerprint`, and by the tasks that
+    # use the source records; the table has many more.
+
+    FETCH_COLUMNS = [
+        "sn",
+        "hostname",
+        "loginIp",
+        "siteName",
+        "family",
+        "vendor",
+        "model",
+    ]
+
     async def fetch(self, **params):
         if (filters := params.get("filters")) is not None:
-            params["filters"] = parse_filter(filters)
+            params["filters"] = ipf_filters(filters)
 
-        self.source_records.extend(await self.source.client.fetch_devices(**params))
+        records = self.source.table_records(
+            self.source.client.fetch_devices, columns=self.FETCH_COLUMNS, **params
+        )
+        self.source_records.extend([rec async for rec in records])
 
     def fingerprint(self, rec: Dict) -> Dict:
         return dict(
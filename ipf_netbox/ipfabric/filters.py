@@ -0,0 +1,121 @@
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, Any, Union
+from functools import lru_cache
+from copy import deepcopy
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+from aioipfabric.filters import parse_filter
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["F", "Column", "ipf_filters"]
+
+
+# -----------------------------------------------------------------------------
+#
+#                              CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class Column(object):
+    """
+    A table column in a filter expression, as returned by `F.<column>`.  The
+    comparison operators and methods return the IPF filter dictionary, for
+    example `F.hostname == "sw1"` returns {"hostname": ["eq", "sw1"]}.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def _filter(self, operator: str, value: Any) -> Dict:
+        return {self.name: [operator, value]}
+
+    def __eq__(self, value) -> Dict:
+        return self._filter("eq", value)
+
+    def __ne__(self, value) -> Dict:
+        return self._filter("neq", value)
+
+    def __lt__(self, value) -> Dict:
+        return self._filter("lt", value)
+
+    def __le__(self, value) -> Dict:
+        return self._filter("lte", value)
+
+    def __gt__(self, value) -> Dict:
+        return self._filter("gt", value)
+
+    def __ge__(self, value) -> Dict:
+        return self._filter("gte", value)
+
+    def like(self, value: str) -> Dict:
+        return self._filter("like", value)
+
+    def notlike(self, value: str) -> Dict:
+        return self._filter("notlike", value)
+
+    def reg(self, value: str) -> Dict:
+        return self._filter("reg", value)
+
+    def nreg(self, value: str) -> Dict:
+        return self._filter("nreg", value)
+
+    def cidr(self, value: str) -> Dict:
+        return self._filter("cidr", value)
+
+    def empty(self, value: bool = True) -> Dict:
+        return self._filter("empty", value)
+
+
+class _FilterBuilder(object):
+    """
+    Builds the IPF filters dictionary directly, rather than by parsing a
+    filter expression string, so that values need no quoting.  For example:
+
+        F.and_(F.hostname == "sw1", F.intName.reg("Et.*"))
+
+    is the same as parse_filter("and(hostname = sw1, intName =~ 'Et.*')").
+    """
+
+    def __getattr__(self, name: str) -> Column:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return Column(name)
+
+    @staticmethod
+    def and_(*filters: Dict) -> Dict:
+        return {"and": list(filters)}
+
+    @staticmethod
+    def or_(*filters: Dict) -> Dict:
+        return {"or": list(filters)}
+
+
+F = _FilterBuilder()
+
+
+@lru_cache(maxsize=256)
+def _parse_filter(expr: str) -> Dict:
+    return parse_filter(expr)
+
+
+def ipf_filters(filters: Union[str, Dict]) -> Dict:
+    """
+    Return the IPF filters dictionary for the filters, either an expression
+    string or a filters dictionary, for example built with `F`.  Expression
+    strings are parsed once, and a copy of the parsed dictionary is returned
+    so that the Caller may change it.
+    """
+    if isinstance(filters, str):
+        return deepcopy(_parse_filter(filters))
+
+    return filters
@@ -1,30 +1,42 @@
-from typing import Dict
+from typing import Dict, Optional, Set
 
-from aioipfabric.filters import parse_filter
 
 from ipf_netbox.collection import Collector
+from ipf_netbox.ipfabric.filters import ipf_filters
+from ipf_netbox.ipfabric.scoped import HostnameScopedMixin
 from ipf_netbox.collections.interfaces import InterfaceCollection
 from ipf_netbox.ipfabric.source import IPFabricSource
 
 from ipf_netbox.mappings import expand_interface, normalize_hostname
 
 
-class IPFabricInterfaceCollection(Collector, InterfaceCollection):
+class IPFabricInterfaceCollection(Collector, HostnameScopedMixin, InterfaceCollection):
     source_class = IPFabricSource
 
-    async def fetch(self, **params):
+    # the table columns used by `fingerprint`.
+
+    FETCH_COLUMNS = ["hostname", "intName", "dscr", "siteName"]
+
+    async def fetch(self, hostnames: Optional[Set[str]] = None, **params):
 
         if (filters := params.get("filters")) is not None:
-            params["filters"] = parse_filter(filters)
-
-        self.source_records.extend(
-            await self.source.client.fetch_table(
-                url="/tables/inventory/interfaces",
-                columns=["hostname", "intName", "dscr", "siteName"],
-                **params,
-            )
+            params["filters"] = ipf_filters(filters)
+
+        # the interfaces table is large; fetch it in pages and key the records
+        # as the pages arrive.
+
+        records = self.source.table_records(
+            self.source.client.fetch_table,
+            url="/tables/inventory/interfaces",
+            columns=self.FETCH_COLUMNS,
+            **params,
         )
 
+        if hostnames is not None:
+            records = self.scope_records(records, hostnames)
+
+        await self.stream_keys(records)
+
     def fingerprint(self, rec: Dict) -> Dict:
         return {
             "interface": expand_interface(rec["intName"]),
@@ -1,29 +1,40 @@
-from typing import Dict
+from typing import Dict, Optional, Set
 
-from aioipfabric.filters import parse_filter
 
 from ipf_netbox.collection import Collector
+from ipf_netbox.ipfabric.filters import ipf_filters
+from ipf_netbox.ipfabric.scoped import HostnameScopedMixin
 from ipf_netbox.collections.ipaddrs import IPAddrCollection
 from ipf_netbox.ipfabric.source import IPFabricSource
 from ipf_netbox.mappings import normalize_hostname, expand_interface
 
 
-class IPFabricIPAddrCollection(Collector, IPAddrCollection):
+class IPFabricIPAddrCollection(Collector, HostnameScopedMixin, IPAddrCollection):
     source_class = IPFabricSource
 
-    async def fetch(self, **params):
+    # the table columns used by `fingerprint`.
+
+    FETCH_COLUMNS = ["hostname", "intName", "siteName", "ip", "net"]
+
+    async def fetch(self, hostnames: Optional[Set[str]] = None, **params):
 
         if (filters := params.get("filters")) is not None:
-            params["filters"] = parse_filter(filters)
-
-        self.source_records.extend(
-            await self.source.client.fetch_table(
-                url="tables/addressing/managed-devs",
-                columns=["hostname", "intName", "siteName", "ip", "net"],
-                **params,
-            )
+            params["filters"] = ipf_filters(filters)
+
+        # fetch the table in pages, and key the records as the pages arrive.
+
+        records = self.source.table_records(
+            self.source.client.fetch_table,
+            url="tables/addressing/managed-devs",
+            columns=self.FETCH_COLUMNS,
+            **params,
         )
 
+        if hostnames is not None:
+            records = self.scope_records(records, hostnames)
+
+        await self.stream_keys(records)
+
     def fingerprint(self, rec: Dict) -> Dict:
         try:
             pflen = rec["net"].split("/")[-1]
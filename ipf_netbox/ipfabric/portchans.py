@@ -1,27 +1,38 @@
-from typing import Dict
+from typing import Dict, Optional, Set
 
-from aioipfabric.filters import parse_filter
 from aioipfabric.mixins.portchan import IPFPortChannels
 
 from ipf_netbox.collection import Collector
+from ipf_netbox.ipfabric.filters import ipf_filters
+from ipf_netbox.ipfabric.scoped import HostnameScopedMixin
 from ipf_netbox.collections.portchans import PortChannelCollection
 from ipf_netbox.ipfabric.source import IPFabricSource, IPFabricClient
 
 from ipf_netbox.mappings import expand_interface, normalize_hostname
 
 
-class IPFabricPortChannelCollection(Collector, PortChannelCollection):
+class IPFabricPortChannelCollection(
+    Collector, HostnameScopedMixin, PortChannelCollection
+):
     source_class = IPFabricSource
 
-    async def fetch(self, **params):
+    # the member-status table columns used to create the member records; the
+    # client default also includes "sn", "siteName" and "protocol".
+
+    FETCH_COLUMNS = ["hostname", "intName", "members"]
+
+    async def fetch(self, hostnames: Optional[Set[str]] = None, **params):
 
         api: IPFabricClient(IPFPortChannels) = self.source.client
         api.mixin(IPFPortChannels)
 
         if (filters := params.get("filters")) is not None:
-            params["filters"] = parse_filter(filters)
+            params["filters"] = ipf_filters(filters)
 
-        records = await api.fetch_portchannels(**params)
+        records = self.source.table_records(
+            api.fetch_portchannels, columns=self.FETCH_COLUMNS, **params
+        )
+        records = [rec async for rec in records]
         api.xf_portchannel_members(records)
 
         # invert these records to a flat list of fields.
@@ -33,6 +44,7 @@ class IPFabricPortChannelCollection(Collector, PortChannelCollection):
                 portchan=rec["intName"],
             )
             for rec in records
+            if self.in_scope(rec, hostnames)
             for member in rec["members"]
         ]
 
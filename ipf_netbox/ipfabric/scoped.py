@@ -0,0 +1,112 @@
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, Iterable, Optional, Set, AsyncIterator
+import asyncio
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from ipf_netbox.ipfabric.source import IPFabricClient
+from ipf_netbox.ipfabric.filters import F
+from ipf_netbox.mappings import normalize_hostname
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["HostnameScopedMixin", "hostname_filter"]
+
+
+# -----------------------------------------------------------------------------
+#
+#                              CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+def hostname_filter(hostnames: Iterable[str]) -> Dict:
+    """
+    Return the IPF filters dictionary that matches any of the given hostnames,
+    that is "or(hostname = a, hostname = b, ...)".
+    """
+    return F.or_(*(F.hostname == hostname for hostname in hostnames))
+
+
+class HostnameScopedMixin(object):
+    """
+    Mixin for the IP Fabric collections whose records belong to a device, for
+    example interfaces, that fetches the records of many devices using as few
+    API queries as the scope allows; see `fetch_scope`.
+
+    The collection `fetch` method accepts the `hostnames` parameter, the set
+    of normalized hostnames whose records are kept, and applies it to the
+    records using `in_scope` or `scope_records`.
+    """
+
+    # the max number of hostnames in a single or(...) filter.
+
+    FILTER_CHUNK_SZ = 100
+
+    # the scope is fetched as the full table, filtered locally, when the scope
+    # includes at least this ratio of all IP Fabric devices.
+
+    FULL_FETCH_RATIO = 0.5
+
+    async def fetch_scope(self, hostnames: Iterable[str]) -> str:
+        """
+        Fetch the records of the given devices, choosing the fetch strategy by
+        the number of devices in scope relative to the number of devices in IP
+        Fabric:
+
+            * "full": fetch the entire table, keeping the records in scope
+            * "devices": use or(hostname = ...) filters, in chunks of
+              FILTER_CHUNK_SZ hostnames
+
+        Parameters
+        ----------
+        hostnames:
+            The device hostnames in scope.
+
+        Returns
+        -------
+        The description of the strategy used, for reporting.
+        """
+        client: IPFabricClient = self.source.client
+        hostnames = sorted(set(hostnames))
+
+        # count the devices using the hostname column, rather than the table
+        # count, so that the table cache is used when enabled.
+
+        devices = self.source.table_records(client.fetch_devices, columns=["hostname"])
+        total = len([rec async for rec in devices])
+
+        if total and len(hostnames) >= self.FULL_FETCH_RATIO * total:
+            await self.fetch(hostnames=set(map(normalize_hostname, hostnames)))
+            return f"full table, {len(hostnames)} of {total} devices"
+
+        chunks = [
+            hostnames[start : start + self.FILTER_CHUNK_SZ]
+            for start in range(0, len(hostnames), self.FILTER_CHUNK_SZ)
+        ]
+
+        await asyncio.gather(
+            *(self.fetch(filters=hostname_filter(chunk)) for chunk in chunks)
+        )
+
+        return f"{len(hostnames)} devices in {len(chunks)} queries"
+
+    @staticmethod
+    def in_scope(rec: Dict, hostnames: Optional[Set[str]]) -> bool:
+        """return True if the record belongs to one of the hostnames, if any"""
+        return hostnames is None or normalize_hostname(rec["hostname"]) in hostnames
+
+    async def scope_records(
+        self, records: AsyncIterator[Dict], hostnames: Optional[Set[str]]
+    ) -> AsyncIterator[Dict]:
+        """yield the records that belong to one of the hostnames, if any"""
+        async for rec in records:
+            if self.in_scope(rec, hostnames):
+                yield rec
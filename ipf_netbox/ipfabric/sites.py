@@ -9,11 +9,17 @@ class IPFabricSiteCollection(Collector, SiteCollection):
     name = "sites"
     source_class = IPFabricSource
 
+    # the table columns used by `fingerprint`.
+
+    FETCH_COLUMNS = ["siteName"]
+
     async def fetch(self):
-        ipf = self.source.client
-        self.source_records.extend(
-            await ipf.fetch_table(url="tables/inventory/sites", columns=["siteName"])
+        records = self.source.table_records(
+            self.source.client.fetch_table,
+            url="tables/inventory/sites",
+            columns=self.FETCH_COLUMNS,
         )
+        self.source_records.extend([rec async for rec in records])
 
     def fingerprint(self, rec: Dict) -> Dict:
         return {"name": rec["siteName"]}
@@ -1,12 +1,35 @@
 import os
+import asyncio
+from collections import deque
+from itertools import islice
 from operator import itemgetter
 
-from ipf_netbox.source import Source
+from typing import List, Dict, Callable, AsyncIterator
+
+from httpx import AsyncHTTPTransport, Response
+
+from ipf_netbox.source import Source, http_options
+from ipf_netbox.config import get_source_config, get_cache_dir, TableCacheModel
+from ipf_netbox.ipfabric.tablecache import TableCache
+from ipf_netbox.codec import loads
 from aioipfabric.client import IPFabricClient
+from aioipfabric.api import IPFSession
 
 NAME = "ipfabric"
 
-__all__ = ["IPFabricSource", "IPFabricClient"]
+__all__ = [
+    "IPFabricSource",
+    "IPFabricClient",
+    "PooledIPFabricClient",
+    "table_data",
+    "paginate_table",
+]
+
+# the default number of records per page, and the max number of pages in
+# flight, for `paginate_table`.
+
+TABLE_PAGE_SZ = 5000
+TABLE_PREFETCH = 4
 
 
 def _init_check():
@@ -21,6 +44,154 @@ def _init_check():
 _init_check()
 
 
+class PooledIPFabricClient(IPFabricClient):
+    """
+    The IPF client whose API session uses the connection pool options of the
+    source `http` config.
+
+    The IPFSession does not accept the httpx client options, and IPFBaseClient
+    creates the session, or a new one on `login` when the prior session was
+    closed.  There is no public httpx API to change the transport of a client,
+    so the private AsyncClient `_transport` of each new session is replaced
+    before its first request, and the replaced transport closed.
+    """
+
+    async def login(self):
+        # create the new session here, as IPFBaseClient.login would, so that
+        # its transport is replaced before the login requests.
+
+        if self.api.token and self.api.is_closed:
+            self.api = IPFSession(base_url=str(self.api.base_url), token=self.api.token)
+
+        await self._use_pool(self.api)
+        await super().login()
+
+    @staticmethod
+    async def _use_pool(api: IPFSession):
+        if getattr(api, "_pooled", False):
+            return
+
+        replaced, api._transport = api._transport, AsyncHTTPTransport(
+            verify=False,
+            **http_options(
+                get_source_config(NAME).http, max_connections=api.API_THROTTLE
+            ),
+        )
+        api._pooled = True
+        await replaced.aclose()
+
+
 class IPFabricSource(Source):
     name = NAME
-    client_class = IPFabricClient
+    client_class = PooledIPFabricClient
+
+    def __init__(self):
+        super().__init__()
+        config = get_source_config(NAME)
+
+        # the on-disk cache of table records, per IP Fabric server, when the
+        # config defines a cache directory; see `table_records`.
+
+        table_cache = config.table_cache or TableCacheModel()
+        directory = get_cache_dir(NAME, "tables", self.client.api.base_url.host)
+        self.table_cache = (
+            TableCache(directory, max_snapshots=table_cache.max_snapshots)
+            if table_cache.enabled and directory is not None
+            else None
+        )
+
+    def table_records(self, fetch: Callable, **kwargs) -> AsyncIterator[Dict]:
+        """
+        Return an async iterator of the table records, fetched in pages by
+        `paginate_table`.  When the table cache is enabled, the records of the
+        active snapshot are used from, or stored to, the cache.
+
+        Parameters
+        ----------
+        fetch:
+            The IPF client table API method, for example `client.fetch_table`.
+
+        Other Parameters
+        ----------------
+        The table API parameters, for example url, columns and filters.
+        """
+        snapshot = self.client.active_snapshot
+        if self.table_cache is None or snapshot is None:
+            return paginate_table(fetch, **kwargs)
+
+        return self.table_cache.records(
+            snapshot,
+            query=dict(kwargs, fetch=fetch.__name__),
+            fetcher=lambda: paginate_table(fetch, **kwargs),
+        )
+
+
+def table_data(res: Response) -> List[Dict]:
+    """
+    Return the table records from the IPF table API response, as returned
+    when called with return_as="raw".  The response body is decoded with the
+    fast JSON codec, if available.
+    """
+    return _table_body(res)["data"]
+
+
+def _table_body(res: Response) -> Dict:
+    res.raise_for_status()
+    return loads(res.content)
+
+
+async def paginate_table(
+    fetch: Callable,
+    page_sz: int = TABLE_PAGE_SZ,
+    prefetch: int = TABLE_PREFETCH,
+    **kwargs,
+) -> AsyncIterator[Dict]:
+    """
+    Fetch the table records in pages, yielding each record as the pages
+    arrive, in table order.  At most `prefetch` page requests are in flight,
+    so that the memory used is bounded by the pages in flight rather than the
+    size of the table.  The first page provides the total count.
+
+    Parameters
+    ----------
+    fetch:
+        The IPF client table API method, for example `client.fetch_table`.
+
+    page_sz:
+        The number of records per page.
+
+    prefetch:
+        The max number of pages fetched concurrently ahead of the Caller.
+
+    Other Parameters
+    ----------------
+    The table API parameters, for example url, columns and filters.
+    """
+
+    def _get_page(start):
+        pagination = dict(start=start, limit=page_sz)
+        return asyncio.create_task(
+            fetch(pagination=pagination, return_as="raw", **kwargs)
+        )
+
+    body = _table_body(await _get_page(0))
+    for rec in body["data"]:
+        yield rec
+
+    starts = iter(range(page_sz, body["_meta"]["count"], page_sz))
+    window = deque(_get_page(start) for start in islice(starts, prefetch))
+
+    try:
+        while window:
+            res = await window.popleft()
+            if (start := next(starts, None)) is not None:
+                window.append(_get_page(start))
+
+            for rec in table_data(res):
+                yield rec
+
+    finally:
+        # if the Caller stops consuming early, or a page fails, then cancel
+        # any pages that remain in-flight.
+        for task in window:
+            task.cancel()
@@ -0,0 +1,162 @@
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, List, Callable, AsyncIterator
+from pathlib import Path
+import sqlite3
+import hashlib
+import json
+import time
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from ipf_netbox.codec import loads, dumps
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["TableCache"]
+
+
+# -----------------------------------------------------------------------------
+#
+#                              CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tables (
+    key TEXT PRIMARY KEY, snapshot TEXT NOT NULL, used REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    key TEXT NOT NULL, seq INTEGER NOT NULL, snapshot TEXT NOT NULL,
+    data BLOB NOT NULL, PRIMARY KEY (key, seq)
+);
+"""
+
+
+class TableCache(object):
+    """
+    An on-disk cache of IP Fabric table records.  IP Fabric snapshots do not
+    change, so the records of a table query are stored by the snapshot ID and
+    the query parameters, for example url, columns and filters, and are used
+    by later runs against the same snapshot without expiry.  The records are
+    stored in an sqlite database, in pages, so that neither storing nor
+    reading a table holds more than a page of encoded records in memory.
+
+    Parameters
+    ----------
+    directory:
+        The directory of the cache database.
+
+    max_snapshots:
+        The number of most recently used snapshots whose records are kept.
+    """
+
+    # the number of records stored per database row.
+
+    PAGE_SZ = 5000
+
+    def __init__(self, directory: Path, max_snapshots: int):
+        self.max_snapshots = max_snapshots
+        self._db = sqlite3.connect(directory.joinpath("tables.sqlite"))
+        self._db.executescript(_SCHEMA)
+
+    async def records(
+        self,
+        snapshot: str,
+        query: Dict,
+        fetcher: Callable[[], AsyncIterator[Dict]],
+    ) -> AsyncIterator[Dict]:
+        """
+        Yield the table records for the snapshot and query parameters.  If the
+        records are not cached, then use the `fetcher` to fetch the records and
+        store them as they arrive.  The records are only used by later calls
+        once all of them are stored, so a fetch that fails, or is not consumed
+        to the end, is fetched again.
+        """
+        key = hashlib.sha1(
+            json.dumps([snapshot, query], sort_keys=True, default=str).encode()
+        ).hexdigest()
+
+        with self._db:
+            hit = self._db.execute(
+                "UPDATE tables SET used = ? WHERE key = ?", (time.time(), key)
+            ).rowcount
+
+        if hit:
+            for seq in range(self._page_count(key)):
+                for rec in self._load_page(key, seq):
+                    yield rec
+            return
+
+        with self._db:
+            self._db.execute("DELETE FROM pages WHERE key = ?", (key,))
+
+        seq, page = 0, list()
+
+        async for rec in fetcher():
+            page.append(rec)
+            if len(page) < self.PAGE_SZ:
+                continue
+
+            # store the page before the Caller sees, and could change, the
+            # records.
+
+            self._store_page(key, snapshot, seq, page)
+            for page_rec in page:
+                yield page_rec
+
+            seq, page = seq + 1, list()
+
+        self._store_page(key, snapshot, seq, page)
+
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO tables VALUES (?, ?, ?)",
+                (key, snapshot, time.time()),
+            )
+        self._prune()
+
+        for rec in page:
+            yield rec
+
+    # -------------------------------------------------------------------------
+    #                         Database Methods
+    # -------------------------------------------------------------------------
+
+    def _page_count(self, key: str) -> int:
+        (count,) = self._db.execute(
+            "SELECT COUNT(*) FROM pages WHERE key = ?", (key,)
+        ).fetchone()
+        return count
+
+    def _load_page(self, key: str, seq: int) -> List[Dict]:
+        (data,) = self._db.execute(
+            "SELECT data FROM pages WHERE key = ? AND seq = ?", (key, seq)
+        ).fetchone()
+        return loads(data)
+
+    def _store_page(self, key: str, snapshot: str, seq: int, page: List[Dict]):
+        with self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO pages VALUES (?, ?, ?, ?)",
+                (key, seq, snapshot, dumps(page)),
+            )
+
+    def _prune(self):
+        """remove the records of all but the most recently used snapshots"""
+        keep = """
+            SELECT snapshot FROM tables GROUP BY snapshot
+            ORDER BY MAX(used) DESC LIMIT ?
+        """
+        with self._db:
+            for table in ("pages", "tables"):
+                self._db.execute(
+                    f"DELETE FROM {table} WHERE snapshot NOT IN ({keep})",
+                    (self.max_snapshots,),
+                )
@@ -0,0 +1,146 @@
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, Tuple, Hashable, Optional
+from collections import deque
+import asyncio
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["AIMDLimiter"]
+
+
+# -----------------------------------------------------------------------------
+#
+#                              CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class AIMDLimiter(object):
+    """
+    An asyncio concurrency limiter whose limit adapts to the health of the
+    server using additive-increase / multiplicative-decrease (AIMD), as in TCP
+    congestion control.
+
+    Each healthy request completion raises the limit by 1/limit, that is by
+    about one per window of requests.  A request that fails, or whose latency
+    is more than `latency_factor` times the baseline latency for its kind,
+    reduces the limit by the `decrease` factor.  Only one decrease is applied
+    per window: requests that were started before the last decrease do not
+    cause another.
+
+    Examples
+    --------
+        limiter = AIMDLimiter(initial=20, maximum=200)
+
+        token = await limiter.acquire()
+        try:
+            res = await client.get(...)
+        finally:
+            limiter.release(token, key="GET", ok=not res.is_error)
+    """
+
+    def __init__(
+        self,
+        initial: int = 20,
+        minimum: int = 2,
+        maximum: int = 200,
+        decrease: float = 0.5,
+        latency_factor: float = 3.0,
+    ):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+
+        # the lowest and highest limit values reached, for reporting purposes.
+
+        self.low = self.high = initial
+
+        self.inflight = 0
+        self._waiters = deque()
+        self._epoch = 0
+        self._baseline: Dict[Hashable, float] = dict()
+
+    async def acquire(self) -> Tuple[float, int]:
+        """
+        Wait until the number of requests in-flight is below the limit, and
+        return the token that must be passed to `release`.
+        """
+        loop = asyncio.get_event_loop()
+
+        while self.inflight >= int(self.limit):
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # a waiter that was woken, but cancelled before it ran, passes
+                # the request slot on to the next waiter.
+                if waiter.done():
+                    self._wake()
+                else:
+                    self._waiters.remove(waiter)
+                raise
+
+        self.inflight += 1
+        return loop.time(), self._epoch
+
+    def release(
+        self, token: Tuple[float, int], key: Hashable, ok: Optional[bool] = True
+    ):
+        """
+        Release the request slot and adjust the limit based on the request
+        outcome (ok) and latency.  The `key` identifies the kind of request,
+        for example the HTTP method and URL path, so that latency is compared
+        with that of similar requests.  If `ok` is None, for example the
+        request was cancelled, then the limit is not adjusted.
+        """
+        started, epoch = token
+        latency = asyncio.get_event_loop().time() - started
+        self.inflight -= 1
+
+        if ok is None:
+            pass
+
+        elif ok and not self._is_slow(key, latency):
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self.high = max(self.high, int(self.limit))
+
+        elif epoch == self._epoch:
+            self.limit = max(self.minimum, self.limit * self.decrease)
+            self.low = min(self.low, int(self.limit))
+            self._epoch += 1
+
+        self._wake()
+
+    def _is_slow(self, key: Hashable, latency: float) -> bool:
+        """
+        Return True if the latency is a spike compared to the baseline latency
+        for the key.  The baseline follows the lowest latency observed, and
+        drifts slowly upwards so that it recovers from an unusually fast
+        response.
+        """
+        if (baseline := self._baseline.get(key)) is None:
+            self._baseline[key] = latency
+            return False
+
+        if latency < baseline:
+            self._baseline[key] = latency
+        else:
+            self._baseline[key] = baseline + (latency - baseline) * 0.01
+
+        return latency > baseline * self.latency_factor
+
+    def _wake(self):
+        """wake a waiter for each available request slot"""
+        for _ in range(int(self.limit) - self.inflight):
+            while self._waiters:
+                if not (waiter := self._waiters.popleft()).done():
+                    waiter.set_result(None)
+                    break
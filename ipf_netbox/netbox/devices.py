@@ -11,7 +11,8 @@ import asyncio
 
 from ipf_netbox.collection import Collector, CollectionCallback
 from ipf_netbox.collections.devices import DeviceCollection
-from ipf_netbox.netbox.source import NetboxSource, NetboxClient
+from ipf_netbox.netbox.source import NetboxSource
+from ipf_netbox.netbox.schemas import DeviceRecord
 from ipf_netbox.config import get_config
 
 # -----------------------------------------------------------------------------
@@ -33,11 +34,22 @@ _DEVICES_URL = "/dcim/devices/"
 class NetboxDeviceCollection(Collector, DeviceCollection):
     source_class = NetboxSource
 
+    # the device record fields used by the fingerprint and the incremental
+    # fetch; the remaining fields are not decoded when msgspec is installed.
+
+    RECORD_SCHEMA = DeviceRecord
+
     async def fetch(self, **kwargs):
         """ exclude devices without a platform or primary-ip address """
+
+        # the devices are fetched incrementally; only the devices changed
+        # since the prior run are fetched from Netbox.
+
         self.source_records.extend(
-            await self.source.client.paginate(
-                url=_DEVICES_URL, filters={"exclude": "config_context"},
+            await self.source.client.paginate_incremental(
+                url=_DEVICES_URL,
+                filters={"exclude": "config_context"},
+                schema=self.RECORD_SCHEMA,
             )
         )
 
@@ -73,10 +85,12 @@ class NetboxDeviceCollection(Collector, DeviceCollection):
         nb_api = self.source.client
 
         device_types, sites, device_role, platforms = await asyncio.gather(
-            nb_api.paginate(url="/dcim/device-types/"),
-            nb_api.paginate(url="/dcim/sites/"),
-            nb_api.paginate(url="/dcim/device-roles/", filters={"slug": "unknown"}),
-            nb_api.paginate(url="/dcim/platforms/"),
+            nb_api.fetch_refdata(url="/dcim/device-types/"),
+            nb_api.fetch_refdata(url="/dcim/sites/"),
+            nb_api.fetch_refdata(
+                url="/dcim/device-roles/", filters={"slug": "unknown"}
+            ),
+            nb_api.fetch_refdata(url="/dcim/platforms/"),
         )
 
         device_types = {rec["slug"]: rec["id"] for rec in device_types}
@@ -84,7 +98,7 @@ class NetboxDeviceCollection(Collector, DeviceCollection):
         role_unknwon = device_role[0]["id"]
         platforms = {rec["slug"]: rec["id"] for rec in platforms}
 
-        def _create_task(key, fields):  # noqa
+        def _create_item(key, fields):  # noqa
             model = fields["model"]
             hostname = fields["hostname"]
             if (dt_slug := config.maps["models"].get(model, "")) == "":
@@ -109,26 +123,21 @@ class NetboxDeviceCollection(Collector, DeviceCollection):
                 )
                 return None
 
-            return nb_api.post(
-                url="/dcim/devices/",
-                json={
-                    "name": fields["hostname"],
-                    "serial": fields["sn"],
-                    "device_role": role_unknwon,
-                    "platform": pl_id,
-                    "site": site_id,
-                    "device_type": dt_id,
-                },
-            )
+            return {
+                "name": fields["hostname"],
+                "serial": fields["sn"],
+                "device_role": role_unknwon,
+                "platform": pl_id,
+                "site": site_id,
+                "device_type": dt_id,
+            }
 
-        await self.source.update(missing, callback, _create_task)
+        await self.source.update_bulk(missing, callback, _create_item, url=_DEVICES_URL)
 
     async def update_changes(
         self, changes: Dict, callback: Optional[CollectionCallback] = None
     ):
 
-        api: NetboxClient = self.source.client
-
         # ensure that the 'ipaddrs' Collection is in the cache.
 
         if (cached_ipaddrs := self.cache.get("ipaddrs")) is None:
@@ -155,7 +164,7 @@ class NetboxDeviceCollection(Collector, DeviceCollection):
             for rec in cached_ipaddrs.source_record_keys.values()
         }
 
-        def _create_task(key, fields: dict):
+        def _patch_item(key, fields: dict):
             """ key is the seriali number """
             patch_payload = {}
 
@@ -170,11 +179,9 @@ class NetboxDeviceCollection(Collector, DeviceCollection):
             if not len(patch_payload):
                 return None
 
-            dev_id = self.source_record_keys[key]["id"]
-
-            # Note: no slash between the base URL and the dev_id since the
-            #       base url has a slash-suffix
+            patch_payload["id"] = self.source_record_keys[key]["id"]
+            return patch_payload
 
-            return api.patch(url=f"{_DEVICES_URL}{dev_id}/", json=patch_payload)
-
-        await self.source.update(changes, callback, creator=_create_task)
+        await self.source.update_bulk(
+            changes, callback, creator=_patch_item, url=_DEVICES_URL, method="PATCH"
+        )
@@ -0,0 +1,115 @@
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, Optional, Set, Tuple
+from collections import OrderedDict, defaultdict
+import re
+import time
+
+# -----------------------------------------------------------------------------
+# Public Imports
+# -----------------------------------------------------------------------------
+
+from httpx import Response
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["ResponseCache", "api_endpoint"]
+
+
+# -----------------------------------------------------------------------------
+#
+#                              CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+_OBJECT_ID = re.compile(r"/\d+/?$")
+
+
+def api_endpoint(path: str) -> str:
+    """
+    Return the API endpoint of the path, for example "/dcim/devices/" for
+    both "/dcim/devices/" and "/dcim/devices/12/".
+    """
+    return _OBJECT_ID.sub("/", path)
+
+
+class ResponseCache(object):
+    """
+    An in-memory cache of GET responses for the session.  Entries expire after
+    `ttl` seconds, and the least recently used entry is evicted when there are
+    more than `max_entries`.  A write to an API endpoint invalidates all of the
+    entries for that endpoint; see `invalidate`.
+
+    Parameters
+    ----------
+    ttl:
+        The number of seconds a cache entry is valid.
+
+    max_entries:
+        The maximum number of cache entries.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str, Response]]" = OrderedDict()
+        self._by_endpoint: Dict[str, Set[str]] = defaultdict(set)
+
+        # the number of writes to each endpoint, so that a response fetched
+        # before a write to the endpoint is not cached after the write.
+
+        self._writes: Dict[str, int] = defaultdict(int)
+
+    def get(self, key: str) -> Optional[Response]:
+        """return the cached response for the URL key, or None"""
+        if (entry := self._entries.get(key)) is None:
+            return None
+
+        expires, endpoint, res = entry
+        if time.monotonic() >= expires:
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return res
+
+    def writes(self, path: str) -> int:
+        """return the number of writes to the API endpoint of the path"""
+        return self._writes[api_endpoint(path)]
+
+    def put(self, key: str, path: str, res: Response, writes: int):
+        """
+        Cache the response for the URL key and the URL API path, unless the
+        endpoint was written since the request was sent; that is, the endpoint
+        `writes` value at the time of the request has changed.
+        """
+        endpoint = api_endpoint(path)
+        if self._writes[endpoint] != writes:
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl, endpoint, res)
+        self._entries.move_to_end(key)
+        self._by_endpoint[endpoint].add(key)
+
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, path: str):
+        """
+        Invalidate the entries for the API endpoint of the path; for example a
+        write to "/dcim/devices/12/" invalidates the "/dcim/devices/" and the
+        "/dcim/devices/<id>/" entries.
+        """
+        endpoint = api_endpoint(path)
+        self._writes[endpoint] += 1
+
+        for key in self._by_endpoint.pop(endpoint, ()):
+            self._entries.pop(key, None)
+
+    def _remove(self, key: str):
+        _, endpoint, _ = self._entries.pop(key)
+        self._by_endpoint[endpoint].discard(key)
@@ -0,0 +1,152 @@
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, Iterable, List, Optional
+from itertools import islice
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from ipf_netbox.igather import igather
+from ipf_netbox.collection import Collector
+from ipf_netbox.netbox.source import NetboxSource, NetboxClient
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["fetch_collections", "build_query"]
+
+
+# -----------------------------------------------------------------------------
+#
+#                              CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# The GraphQL selections for each of the collections.  The device selection
+# is always used since the device name is part of each collection key.  The
+# selected fields are those used by the collection fingerprints.
+
+_DEVICE_FIELDS = """
+    id name serial status
+    site { id slug }
+    platform { id slug }
+    primary_ip4 { id address }
+    primary_ip6 { id address }
+    device_type { id slug manufacturer { id slug } }
+"""
+
+_INTERFACE_FIELDS = "id name description type lag { id name }"
+
+_IPADDR_FIELDS = " ip_addresses { id address }"
+
+_LAG_KEY_ = "__lag__"
+
+
+def build_query(with_devices=True, with_interfaces=False, with_ipaddrs=False) -> str:
+    """
+    Return the GraphQL query that fetches the devices, by name, with the
+    selected nested records.
+    """
+    selection = _DEVICE_FIELDS if with_devices else "id name"
+
+    if with_interfaces or with_ipaddrs:
+        if_fields = _INTERFACE_FIELDS + (_IPADDR_FIELDS if with_ipaddrs else "")
+        selection += f" interfaces {{ {if_fields} }}"
+
+    return f"query ($names: [String]) {{ device_list(name: $names) {{ {selection} }} }}"
+
+
+async def fetch_collections(
+    source: NetboxSource,
+    hostnames: Iterable[str],
+    devices: Optional[Collector] = None,
+    interfaces: Optional[Collector] = None,
+    ipaddrs: Optional[Collector] = None,
+    portchans: Optional[Collector] = None,
+):
+    """
+    Fetch the records for the given device hostnames using the Netbox GraphQL
+    API, one query per batch of devices, and add the records to the
+    `source_records` of the given collections.  The records have the same
+    structure as the records returned by the REST API, for the fields used
+    by the collections.
+
+    Parameters
+    ----------
+    source:
+        The Netbox source instance.
+
+    hostnames:
+        The device hostnames.
+
+    devices, interfaces, ipaddrs, portchans:
+        The Netbox collections to fetch; each one is optional.
+    """
+    client: NetboxClient = source.client
+    query = build_query(
+        with_devices=devices is not None,
+        with_interfaces=interfaces is not None or portchans is not None,
+        with_ipaddrs=ipaddrs is not None,
+    )
+
+    hostnames = iter(sorted(set(hostnames)))
+    batches = iter(lambda: list(islice(hostnames, client.graphql.batch_size)), [])
+
+    async def _fetch(names: List[str]):
+        body = await client.graphql_query(query, variables=dict(names=names))
+        return body["device_list"]
+
+    if portchans is not None:
+        portchans.cache[portchans] = dict(lag_recs=dict())
+
+    async for _, dev_list in igather(map(_fetch, batches), limit=client.graphql.limit):
+        for dev_rec in dev_list:
+            _split_device(dev_rec, devices, interfaces, ipaddrs, portchans)
+
+
+def _split_device(dev_rec: Dict, devices, interfaces, ipaddrs, portchans):
+    """add the device record, and the nested records, to the collections"""
+
+    if_recs = dev_rec.pop("interfaces", None) or []
+    dev_ref = dict(id=dev_rec["id"], name=dev_rec["name"])
+
+    if devices is not None:
+        dev_rec["status"] = dict(value=dev_rec["status"].lower())
+        dev_rec["primary_ip"] = dev_rec["primary_ip4"] or dev_rec["primary_ip6"]
+        devices.source_records.append(dev_rec)
+
+    lag_recs = dict()
+
+    for if_rec in if_recs:
+        ip_recs = if_rec.pop("ip_addresses", None) or []
+        if_rec["type"] = if_rec["type"].lower()
+        if_rec["device"] = dev_ref
+
+        if interfaces is not None:
+            interfaces.source_records.append(if_rec)
+
+        if ipaddrs is not None:
+            if_ref = dict(id=if_rec["id"], name=if_rec["name"], device=dev_ref)
+            ipaddrs.source_records.extend(
+                dict(ip_rec, interface=if_ref) for ip_rec in ip_recs
+            )
+
+        if if_rec["type"] == "lag":
+            lag_recs[if_rec["id"]] = if_rec
+
+    if portchans is None:
+        return
+
+    portchans.cache[portchans]["lag_recs"].update(
+        ((dev_rec["name"], lag_rec["name"]), lag_rec) for lag_rec in lag_recs.values()
+    )
+
+    for if_rec in if_recs:
+        if (lag := if_rec["lag"]) is not None:
+            portchans.source_records.append(
+                dict(if_rec, **{_LAG_KEY_: lag_recs.get(lag["id"], lag)})
+            )
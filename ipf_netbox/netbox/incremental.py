@@ -0,0 +1,116 @@
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, List, Optional
+from pathlib import Path
+import hashlib
+import json
+import time
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from ipf_netbox.codec import loads, dumps
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["IncrementalStore"]
+
+
+# -----------------------------------------------------------------------------
+#
+#                              CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class IncrementalStore(object):
+    """
+    The local copy of the records for a Netbox API endpoint, and the
+    `last_updated` watermark of those records, stored on disk between runs.
+    The watermark is the largest `last_updated` value of the stored records,
+    so that it uses the Netbox server clock rather than the local one.
+
+    Parameters
+    ----------
+    directory:
+        The directory used to store the records.
+
+    url:
+        The Netbox API endpoint URL, for example "/dcim/devices/".
+
+    filters:
+        The Netbox API filters used to fetch the records.
+
+    fields:
+        The record fields stored, when the records are decoded with a schema.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        url: str,
+        filters: Optional[Dict] = None,
+        fields: Optional[List[str]] = None,
+    ):
+        store_id = hashlib.sha1(
+            json.dumps([url, filters or {}, fields], sort_keys=True).encode()
+        ).hexdigest()
+
+        self.path = directory.joinpath(f"{store_id}.json")
+        self.records: Dict[int, Dict] = dict()
+        self.watermark: Optional[str] = None
+        self.full_sync = 0.0
+
+    def load(self) -> bool:
+        """load the store from disk, return False if it does not exist"""
+        if not self.path.exists():
+            return False
+
+        try:
+            body = loads(self.path.read_bytes())
+            self.watermark = body["watermark"]
+            self.full_sync = body["full_sync"]
+            self.records = {rec["id"]: rec for rec in body["records"]}
+
+        except (ValueError, KeyError):
+            return False
+
+        return True
+
+    def save(self):
+        self.path.write_bytes(
+            dumps(
+                dict(
+                    watermark=self.watermark,
+                    full_sync=self.full_sync,
+                    records=list(self.records.values()),
+                )
+            )
+        )
+
+    def reconcile_due(self, interval: int) -> bool:
+        """return True if the last full sync is older than interval seconds"""
+        return time.time() - self.full_sync >= interval
+
+    def replace(self, records: List[Dict]):
+        """replace all of the records, as the result of a full sync"""
+        self.records = {rec["id"]: rec for rec in records}
+        self.full_sync = time.time()
+        self.watermark = None
+        self._update_watermark(records)
+
+    def merge(self, records: List[Dict]):
+        """merge the records changed since the watermark"""
+        self.records.update((rec["id"], rec) for rec in records)
+        self._update_watermark(records)
+
+    def _update_watermark(self, records: List[Dict]):
+        # ISO-8601 timestamps in the same format compare in time order.
+        stamps = [rec["last_updated"] for rec in records if rec.get("last_updated")]
+        if stamps:
+            self.watermark = max(stamps + ([self.watermark] if self.watermark else []))
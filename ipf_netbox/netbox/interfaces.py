@@ -2,7 +2,7 @@
 # System Imports
 # -----------------------------------------------------------------------------
 
-from typing import Dict, Optional
+from typing import Dict, Optional, get_type_hints
 import asyncio
 
 # -----------------------------------------------------------------------------
@@ -12,6 +12,8 @@ import asyncio
 from ipf_netbox.collection import Collector, CollectionCallback
 from ipf_netbox.collections.interfaces import InterfaceCollection
 from ipf_netbox.netbox.source import NetboxSource, NetboxClient
+from ipf_netbox.netbox.schemas import InterfaceRecord
+from ipf_netbox.netbox.scoped import ScopedFetchMixin
 
 # -----------------------------------------------------------------------------
 # Exports
@@ -26,21 +28,42 @@ __all__ = ["NetboxInterfaceCollection"]
 #
 # -----------------------------------------------------------------------------
 
+_INTFS_URL = "/dcim/interfaces/"
 
-class NetboxInterfaceCollection(Collector, InterfaceCollection):
+
+class NetboxInterfaceCollection(ScopedFetchMixin, Collector, InterfaceCollection):
     source_class = NetboxSource
 
+    FETCH_URL = _INTFS_URL
+    SITE_FILTER = True
+
+    # the interfaces table is one of the largest in Netbox, use id based
+    # pagination to avoid the cost of deep OFFSET values.
+
+    KEYSET_PAGINATE = True
+
+    # the interface record fields used by the fingerprint; the remaining
+    # fields are not fetched when the server supports field selection, and
+    # are not decoded when msgspec is installed.
+
+    RECORD_SCHEMA = InterfaceRecord
+    FETCH_FIELDS = tuple(get_type_hints(InterfaceRecord))
+
     async def fetch(self, hostname, **params):
         """
         fetch interfaces must be done on a per-device (hostname) basis.
         fetch args are Netbox API specific.
         """
+        client: NetboxClient = self.source.client
+        projection = await client.projection(_INTFS_URL, self.FETCH_FIELDS)
 
-        self.source_records.extend(
-            await self.source.client.paginate(
-                url="/dcim/interfaces/", filters=dict(device=hostname, **params)
-            )
-        )
+        async for rec in client.paginate_iter(
+            url=_INTFS_URL,
+            filters=dict(projection, device=hostname, **params),
+            keyset=self.KEYSET_PAGINATE,
+            schema=self.RECORD_SCHEMA,
+        ):
+            self.source_records.append(rec)
 
     async def fetch_keys(self, keys: Dict):
         await asyncio.gather(
@@ -50,6 +73,9 @@ class NetboxInterfaceCollection(Collector, InterfaceCollection):
             )
         )
 
+    def record_hostname(self, rec: Dict) -> str:
+        return rec["device"]["name"]
+
     def fingerprint(self, rec: Dict) -> Dict:
         return dict(
             hostname=rec["device"]["name"],
@@ -63,10 +89,12 @@ class NetboxInterfaceCollection(Collector, InterfaceCollection):
         client: NetboxClient = self.source.client
 
         device_records = await client.fetch_devices(
-            hostname_list=(rec["hostname"] for rec in missing.values()), key="name"
+            hostname_list=(rec["hostname"] for rec in missing.values()),
+            key="name",
+            fields=("id", "name"),
         )
 
-        def _create_task(key, fields):
+        def _create_item(key, fields):
             hostname, if_name = key
             if hostname not in device_records:
                 print(f"ERROR: device {hostname} missing.")
@@ -81,18 +109,15 @@ class NetboxInterfaceCollection(Collector, InterfaceCollection):
                 "p": "lag",  # port-channel
             }.get(if_name[0].lower(), "other")
 
-            return client.post(
-                url="/dcim/interfaces/",
-                json=dict(
-                    device=device_records[hostname]["id"],
-                    name=if_name,
-                    description=fields["description"],
-                    type=if_type,
-                ),
+            return dict(
+                device=device_records[hostname]["id"],
+                name=if_name,
+                description=fields["description"],
+                type=if_type,
             )
 
-        await self.source.update(
-            updates=missing, callback=callback, creator=_create_task
+        await self.source.update_bulk(
+            updates=missing, callback=callback, creator=_create_item, url=_INTFS_URL
         )
 
     async def update_changes(
@@ -101,13 +126,10 @@ class NetboxInterfaceCollection(Collector, InterfaceCollection):
         # Presently the only field to update is description; so we don't need to put
         # much logic into this post body process.  Might need to in the future.
 
-        client = self.source.client
-
-        def _create_task(key, fields):
+        def _patch_item(key, fields):
             if_id = self.source_record_keys[key]["id"]
-            return client.patch(
-                url=f"/dcim/interfaces/{if_id}/",
-                json=dict(description=fields["description"]),
-            )
+            return dict(id=if_id, description=fields["description"])
 
-        await self.source.update(changes, callback, _create_task)
+        await self.source.update_bulk(
+            changes, callback, _patch_item, url=_INTFS_URL, method="PATCH"
+        )
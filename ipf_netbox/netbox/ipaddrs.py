@@ -1,25 +1,48 @@
-from typing import Dict, Optional
+from typing import Dict, Optional, get_type_hints
 from operator import itemgetter
 import asyncio
 
 from ipf_netbox.collection import Collector, CollectionCallback
 from ipf_netbox.collections.ipaddrs import IPAddrCollection
 from ipf_netbox.netbox.source import NetboxSource, NetboxClient
+from ipf_netbox.netbox.schemas import IPAddrRecord
+from ipf_netbox.netbox.scoped import ScopedFetchMixin
 
 _IPAM_ADDR_URL = "/ipam/ip-addresses/"
 
 
-class NetboxIPAddrCollection(Collector, IPAddrCollection):
+class NetboxIPAddrCollection(ScopedFetchMixin, Collector, IPAddrCollection):
     source_class = NetboxSource
 
+    # the ip-addresses endpoint does not support the `site` filter.
+
+    FETCH_URL = _IPAM_ADDR_URL
+    SITE_FILTER = False
+
+    # use id based pagination to avoid the cost of deep OFFSET values on the
+    # (large) ip-addresses table.
+
+    KEYSET_PAGINATE = True
+
+    # the ip-address record fields used by the fingerprint; the remaining
+    # fields are not fetched when the server supports field selection, and
+    # are not decoded when msgspec is installed.
+
+    RECORD_SCHEMA = IPAddrRecord
+    FETCH_FIELDS = tuple(get_type_hints(IPAddrRecord))
+
     async def fetch(self, hostname, **params):
         """ fetch args are Netbox specific API parameters """
+        client: NetboxClient = self.source.client
+        projection = await client.projection(_IPAM_ADDR_URL, self.FETCH_FIELDS)
 
-        self.source_records.extend(
-            await self.source.client.paginate(
-                url=_IPAM_ADDR_URL, filters=dict(device=hostname, **params)
-            )
-        )
+        async for rec in client.paginate_iter(
+            url=_IPAM_ADDR_URL,
+            filters=dict(projection, device=hostname, **params),
+            keyset=self.KEYSET_PAGINATE,
+            schema=self.RECORD_SCHEMA,
+        ):
+            self.source_records.append(rec)
 
     async def fetch_keys(self, keys):
         await asyncio.gather(
@@ -29,6 +52,15 @@ class NetboxIPAddrCollection(Collector, IPAddrCollection):
             )
         )
 
+    def record_hostname(self, rec: Dict) -> Optional[str]:
+        # the ip-addresses table includes addresses that are not assigned to
+        # an interface.
+
+        if (if_dat := rec["interface"]) is None:
+            return None
+
+        return if_dat["device"]["name"]
+
     def fingerprint(self, rec: Dict) -> Dict:
         if_dat = rec["interface"]
         return {
@@ -48,12 +80,10 @@ class NetboxIPAddrCollection(Collector, IPAddrCollection):
 
         if_key_fn = itemgetter("hostname", "interface")
         if_items = map(if_key_fn, missing.values())
-        if_recs = await client.fetch_devices_interfaces(if_items)
+        if_recs = await client.fetch_devices_interfaces(if_items, fields=("id",))
         if_lkup = {(rec["device"]["name"], rec["name"]): rec for rec in if_recs}
 
-        api = self.source.client
-
-        def _create_task(key, fields):
+        def _create_item(key, fields):
             if_key = if_key_fn(fields)
             if (if_rec := if_lkup.get(if_key)) is None:
                 print(
@@ -66,9 +96,11 @@ class NetboxIPAddrCollection(Collector, IPAddrCollection):
             if if_rec["name"].lower().startswith("loopback"):
                 payload["role"] = "loopback"
 
-            return api.post(url=_IPAM_ADDR_URL, json=payload)
+            return payload
 
-        await self.source.update(missing, callback, _create_task)
+        await self.source.update_bulk(
+            missing, callback, _create_item, url=_IPAM_ADDR_URL
+        )
 
     async def update_changes(
         self, changes: Dict, callback: Optional[CollectionCallback] = None
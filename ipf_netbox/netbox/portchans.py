@@ -13,6 +13,7 @@ from ipf_netbox.collection import Collector, CollectionCallback, get_collection
 from ipf_netbox.collections.portchans import PortChannelCollection
 from ipf_netbox.netbox.source import NetboxSource, NetboxClient
 from ipf_netbox.igather import igather
+from ipf_netbox.codec import loads
 
 # -----------------------------------------------------------------------------
 # Exports
@@ -64,7 +65,7 @@ class NetboxPortChanCollection(Collector, PortChannelCollection):
 
         for lag_rec in lag_records:
             res = await nb_api.get(_INTFS_URL, params={"lag_id": lag_rec["id"]})
-            for if_rec in res.json()["results"]:
+            for if_rec in loads(res.content)["results"]:
                 if_rec[_LAG_KEY_] = lag_rec
                 self.source_records.append(if_rec)
 
@@ -89,7 +90,6 @@ class NetboxPortChanCollection(Collector, PortChannelCollection):
         # missing items means that the existing interface does not have any
         # associated LAG.  We need to patch the interface record with the
         # LAG id.
-        api: NetboxClient = self.source.client
 
         # we first need to retrieve all of the interface records
         col_ifaces = get_collection(source=self.source, name="interfaces")
@@ -109,11 +109,11 @@ class NetboxPortChanCollection(Collector, PortChannelCollection):
             if_rec = col_ifaces.source_record_keys[key]
             lag_key = (item["hostname"], item["portchan"])
             lag_rec = self.cache[self]["lag_recs"][lag_key]
-            return api.patch(
-                _INTFS_URL + f"{if_rec['id']}/", json=dict(lag=lag_rec["id"])
-            )
+            return dict(id=if_rec["id"], lag=lag_rec["id"])
 
-        await self.source.update(missing, callback=callback, creator=_patch)
+        await self.source.update_bulk(
+            missing, callback=callback, creator=_patch, url=_INTFS_URL, method="PATCH"
+        )
 
     async def update_changes(
         self, changes: Dict, callback: Optional[CollectionCallback] = None
@@ -135,24 +135,20 @@ class NetboxPortChanCollection(Collector, PortChannelCollection):
 
         col_ifaces.make_keys()
 
-        api: NetboxClient = self.source.client
-
         def _patch(_key, _ch_fields):
             if_rec = col_ifaces.source_record_keys[_key]
             col_fields = self.inventory[_key]
             lag_key = (col_fields["hostname"], _ch_fields["portchan"])
             lag_rec = self.cache[self]["lag_recs"][lag_key]
-            return api.patch(
-                _INTFS_URL + f"{if_rec['id']}/", json=dict(lag=lag_rec["id"])
-            )
+            return dict(id=if_rec["id"], lag=lag_rec["id"])
 
-        await self.source.update(changes, callback=callback, creator=_patch)
+        await self.source.update_bulk(
+            changes, callback=callback, creator=_patch, url=_INTFS_URL, method="PATCH"
+        )
 
     async def remove_extra(
         self, extras: Dict, callback: Optional[CollectionCallback] = None
     ):
-        api: NetboxClient = self.source.client
-
         # we first need to retrieve all of the interface records
         col_ifaces = get_collection(source=self.source, name="interfaces")
 
@@ -169,6 +165,8 @@ class NetboxPortChanCollection(Collector, PortChannelCollection):
 
         def _patch(key, _fields):
             if_rec = col_ifaces.source_record_keys[key]
-            return api.patch(_INTFS_URL + f"{if_rec['id']}/", json=dict(lag=None))
+            return dict(id=if_rec["id"], lag=None)
 
-        await self.source.update(extras, callback=callback, creator=_patch)
+        await self.source.update_bulk(
+            extras, callback=callback, creator=_patch, url=_INTFS_URL, method="PATCH"
+        )
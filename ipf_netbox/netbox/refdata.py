@@ -0,0 +1,135 @@
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, List, Optional, Callable, Awaitable, Tuple
+from pathlib import Path
+import hashlib
+import shutil
+import json
+import time
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from ipf_netbox.codec import loads, dumps
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["RefDataCache"]
+
+
+# -----------------------------------------------------------------------------
+#
+#                              CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class RefDataCache(object):
+    """
+    A cache of Netbox reference data records, for example device-types and
+    sites, that rarely change.  The records are kept in memory for the session,
+    and optionally stored on disk so that later runs can use them.  Cache
+    entries expire after `ttl` seconds, and are invalidated when the tool
+    writes to the reference data URL; see `invalidate`.
+
+    Parameters
+    ----------
+    ttl:
+        The number of seconds a cache entry is valid.
+
+    directory:
+        The directory used to store the cache entries between runs, or None
+        to only use the in-memory cache.
+    """
+
+    def __init__(self, ttl: int, directory: Optional[Path] = None):
+        self.ttl = ttl
+        self.directory = directory
+        self._entries: Dict[Tuple[str, str], Tuple[float, List[Dict]]] = dict()
+
+    async def get(
+        self,
+        url: str,
+        filters: Optional[Dict],
+        fetcher: Callable[[], Awaitable[List[Dict]]],
+    ) -> List[Dict]:
+        """
+        Return the cached records for the url and filters.  If there is no
+        valid cache entry, then use the `fetcher` coroutine function to fetch
+        the records and cache them.
+        """
+        key = (url, json.dumps(filters or {}, sort_keys=True))
+
+        if (entry := self._entries.get(key)) is None:
+            entry = self._load(key)
+
+        if entry and time.time() - entry[0] < self.ttl:
+            self._entries[key] = entry
+            return entry[1]
+
+        records = await fetcher()
+        self._entries[key] = entry = (time.time(), records)
+        self._store(key, entry)
+        return records
+
+    def invalidate(self, path: str):
+        """
+        Invalidate the cache entries for the URLs that the API path belongs to,
+        for example "/dcim/sites/12/" invalidates the "/dcim/sites/" entries.
+        """
+        for url, filters in list(self._entries):
+            if path.startswith(url):
+                del self._entries[(url, filters)]
+
+        if self.directory is None:
+            return
+
+        for url_dir in self.directory.iterdir():
+            if path.startswith(_unslug(url_dir.name)):
+                shutil.rmtree(url_dir, ignore_errors=True)
+
+    # -------------------------------------------------------------------------
+    #                         Disk Cache Methods
+    # -------------------------------------------------------------------------
+
+    def _entry_path(self, key) -> Optional[Path]:
+        if self.directory is None:
+            return None
+
+        url, filters = key
+        filters_id = hashlib.sha1(filters.encode()).hexdigest()
+        return self.directory.joinpath(_slug(url), f"{filters_id}.json")
+
+    def _load(self, key) -> Optional[Tuple[float, List[Dict]]]:
+        if (path := self._entry_path(key)) is None or not path.exists():
+            return None
+
+        try:
+            body = loads(path.read_bytes())
+            return body["timestamp"], body["records"]
+
+        except (ValueError, KeyError):
+            return None
+
+    def _store(self, key, entry):
+        if (path := self._entry_path(key)) is None:
+            return
+
+        timestamp, records = entry
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(dumps(dict(timestamp=timestamp, records=records)))
+
+
+def _slug(url: str) -> str:
+    """return the URL as a directory name, for example 'dcim__sites'"""
+    return url.strip("/").replace("/", "__")
+
+
+def _unslug(name: str) -> str:
+    """return the URL for the directory name created by `_slug`"""
+    return "/" + name.replace("__", "/") + "/"
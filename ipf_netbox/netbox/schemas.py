@@ -0,0 +1,78 @@
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Optional, TypedDict
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["DeviceRecord", "InterfaceRecord", "IPAddrRecord"]
+
+
+# -----------------------------------------------------------------------------
+#
+#                              CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+# The Netbox record schemas declare the subset of the record fields that are
+# used by the collections, primarily by the `fingerprint` methods.  When the
+# msgspec package is installed, the API responses are decoded directly into
+# these (dict) structures and the other fields are skipped by the parser; see
+# `ipf_netbox.codec.projected_decoder`.
+
+
+class _SlugRef(TypedDict):
+    slug: str
+
+
+class _DeviceTypeRef(TypedDict):
+    slug: str
+    manufacturer: _SlugRef
+
+
+class _StatusRef(TypedDict):
+    value: str
+
+
+class _AddressRef(TypedDict):
+    id: int
+    address: str
+
+
+class _DeviceRef(TypedDict):
+    id: int
+    name: Optional[str]
+
+
+class _InterfaceRef(TypedDict):
+    id: int
+    name: str
+    device: _DeviceRef
+
+
+class DeviceRecord(TypedDict):
+    id: int
+    name: Optional[str]
+    serial: str
+    status: _StatusRef
+    site: _SlugRef
+    platform: Optional[_SlugRef]
+    device_type: _DeviceTypeRef
+    primary_ip: Optional[_AddressRef]
+    last_updated: Optional[str]
+
+
+class InterfaceRecord(TypedDict):
+    id: int
+    name: str
+    description: str
+    device: _DeviceRef
+
+
+class IPAddrRecord(TypedDict):
+    id: int
+    address: str
+    interface: Optional[_InterfaceRef]
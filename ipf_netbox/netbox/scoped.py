@@ -0,0 +1,182 @@
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, Iterable, Optional, Set, Any
+from collections import defaultdict
+from urllib.parse import urlencode
+import asyncio
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from ipf_netbox.netbox.source import NetboxClient
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["ScopedFetchMixin"]
+
+
+# -----------------------------------------------------------------------------
+#
+#                              CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+
+class ScopedFetchMixin(object):
+    """
+    Mixin for the Netbox collections whose records belong to a device, for
+    example interfaces, that fetches the records of many devices using as few
+    API queries as the scope allows; see `fetch_scope`.
+
+    The collection defines FETCH_URL and `record_hostname`, and optionally
+    RECORD_SCHEMA, FETCH_FIELDS and KEYSET_PAGINATE.  SITE_FILTER is True when
+    the FETCH_URL endpoint supports the `site` (slug) filter.
+    """
+
+    FETCH_URL = None
+    RECORD_SCHEMA = None
+    FETCH_FIELDS = None
+    KEYSET_PAGINATE = False
+    SITE_FILTER = False
+
+    # the scope is fetched with a single stream of the full table when the
+    # scope includes at least this ratio of all Netbox devices.
+
+    FULL_FETCH_RATIO = 0.5
+
+    # the devices of a site are fetched with the `site` filter when the scope
+    # includes at least this ratio of the site devices.
+
+    SITE_FETCH_RATIO = 0.5
+
+    def record_hostname(self, rec: Dict) -> Optional[str]:
+        """return the record device hostname, or None if it has no device"""
+        raise RuntimeError("Not implemented")
+
+    async def fetch_scope(self, devices: Dict[str, Optional[str]]) -> str:
+        """
+        Fetch the records of the given devices, choosing the fetch strategy by
+        the number of devices in scope relative to the number of devices in
+        Netbox:
+
+            * "full": stream the entire table, when the scope is most of Netbox
+            * "sites": use the `site` filter for sites mostly in scope
+            * "devices": use multi-value `device` filters, chunked by URL length
+
+        Sites not mostly in scope use the "devices" strategy, so the result
+        may be a mix of the latter two.  Devices that have no records from the
+        "sites" strategy, for example because their Netbox site is not their
+        IP Fabric site, are then fetched with the "devices" strategy.  The
+        records of devices that are not in scope are discarded.
+
+        Parameters
+        ----------
+        devices:
+            The device hostnames in scope, and for each the site slug if known.
+
+        Returns
+        -------
+        The description of the strategy used, for reporting.
+        """
+        client: NetboxClient = self.source.client
+        hostnames = set(devices)
+
+        # the site device counts change as devices are added, so they are
+        # fetched rather than taken from the reference data cache.
+
+        site_params = await client.projection("/dcim/sites/", ["slug", "device_count"])
+        site_recs = await client.paginate("/dcim/sites/", filters=site_params)
+        site_counts = {rec["slug"]: rec.get("device_count") or 0 for rec in site_recs}
+        total = sum(site_counts.values())
+
+        projection = await client.projection(self.FETCH_URL, self.FETCH_FIELDS)
+
+        if total and len(hostnames) >= self.FULL_FETCH_RATIO * total:
+            await self._fetch_filtered(hostnames, projection)
+            return f"full table, {len(hostnames)} of {total} devices"
+
+        by_site = defaultdict(set)
+        for hostname, site in devices.items():
+            by_site[site].add(hostname)
+
+        fetch_sites = [
+            site
+            for site, site_hostnames in by_site.items()
+            if self.SITE_FILTER
+            and site_counts.get(site)
+            and len(site_hostnames) >= self.SITE_FETCH_RATIO * site_counts[site]
+        ]
+
+        by_device = hostnames.difference(*(by_site[site] for site in fetch_sites))
+
+        def _device_chunks(names):
+            return list(
+                client.chunk_query(
+                    sorted(names), lambda name: len(urlencode(dict(device=name))) + 1
+                )
+            )
+
+        chunks = _device_chunks(by_device)
+
+        found = await asyncio.gather(
+            *(
+                self._fetch_filtered(by_site[site], dict(projection, site=site))
+                for site in fetch_sites
+            ),
+            *(
+                self._fetch_filtered(set(chunk), dict(projection, device=chunk))
+                for chunk in chunks
+            ),
+        )
+
+        # the site of a device in Netbox may not be the site in IP Fabric, so
+        # the devices with no records from their site are fetched by device.
+
+        missing = set().union(*(by_site[site] for site in fetch_sites))
+        missing = missing.difference(*found[: len(fetch_sites)])
+        if missing:
+            by_device |= missing
+            missing_chunks = _device_chunks(missing)
+            chunks += missing_chunks
+            await asyncio.gather(
+                *(
+                    self._fetch_filtered(set(chunk), dict(projection, device=chunk))
+                    for chunk in missing_chunks
+                )
+            )
+
+        strategy = list()
+        if fetch_sites:
+            strategy.append(f"{len(fetch_sites)} sites")
+        if chunks:
+            strategy.append(f"{len(by_device)} devices in {len(chunks)} queries")
+
+        return ", ".join(strategy) or "no devices"
+
+    async def _fetch_filtered(
+        self, hostnames: Iterable[str], filters: Dict[str, Any]
+    ) -> Set[str]:
+        """
+        fetch the records for the filters, keeping those of the hostnames;
+        records without a device, for example unassigned ip-addresses in the
+        full table, are discarded.  Return the hostnames that have records.
+        """
+        client: NetboxClient = self.source.client
+        found = set()
+
+        async for rec in client.paginate_iter(
+            url=self.FETCH_URL,
+            filters=filters,
+            keyset=self.KEYSET_PAGINATE,
+            schema=self.RECORD_SCHEMA,
+        ):
+            if (hostname := self.record_hostname(rec)) in hostnames:
+                self.source_records.append(rec)
+                found.add(hostname)
+
+        return found
@@ -9,7 +9,8 @@ class NetboxSiteCollection(Collector, SiteCollection):
     source_class = NetboxSource
 
     async def fetch(self):
-        self.source_records.extend(await self.source.client.paginate(url="/dcim/sites"))
+        async for rec in self.source.client.paginate_iter(url="/dcim/sites"):
+            self.source_records.append(rec)
 
     def fingerprint(self, rec: Dict) -> Dict:
         return {"name": rec["slug"]}
@@ -21,8 +22,8 @@ class NetboxSiteCollection(Collector, SiteCollection):
 
         def _creator(key, item):  # noqa
             name = key
-            return api.post(
-                url="/dcim/sites/", json={"name": name, "slug": api.slugify(name)}
-            )
+            return {"name": name, "slug": api.slugify(name)}
 
-        await self.source.update(updates=missing, callback=callback, creator=_creator)
+        await self.source.update_bulk(
+            updates=missing, callback=callback, creator=_creator, url="/dcim/sites/"
+        )
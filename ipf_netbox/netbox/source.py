@@ -1,15 +1,45 @@
-from typing import Optional, Dict, List, Callable
+from typing import (
+    TypedDict,
+    Optional,
+    Dict,
+    List,
+    Callable,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Any,
+    Tuple,
+    get_type_hints,
+)
 import asyncio
+import math
+import random
+from fnmatch import fnmatchcase
+from collections import deque, Counter
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 from os import environ
 from operator import itemgetter
-from itertools import chain, starmap
+from itertools import chain
+from urllib.parse import urlencode
 import re
 import unicodedata
 
 
-from httpx import AsyncClient
+from httpx import AsyncClient, Response, TimeoutException, TransportError, URL
+from httpx import HTTPStatusError, QueryParams
 
-from ipf_netbox.source import Source
+from ipf_netbox.source import Source, http_options
+from ipf_netbox.igather import iawait
+from ipf_netbox.codec import loads, dumps, projected_decoder, JSON_HEADERS
+from ipf_netbox.log import get_logger
+from ipf_netbox.config import get_source_config, get_cache_dir
+from ipf_netbox.config import RetryModel, ConcurrencyModel, RefDataModel
+from ipf_netbox.config import IncrementalModel, GraphQLModel, GetCacheModel
+from ipf_netbox.limiter import AIMDLimiter
+from ipf_netbox.netbox.refdata import RefDataCache
+from ipf_netbox.netbox.incremental import IncrementalStore
+from ipf_netbox.netbox.getcache import ResponseCache, api_endpoint
 
 NAME = "netbox"
 
@@ -17,32 +47,419 @@ NAME = "netbox"
 class NetboxClient(AsyncClient):
     ENV_VARS = ["NETBOX_ADDR", "NETBOX_TOKEN"]
     DEFAULT_PAGE_SZ = 100
-    API_RATE_LIMIT = 100
+    DEFAULT_PREFETCH = 8
+    MAX_PAGE_SIZE = 1000
+
+    # max length of the multi-value filter portion of a URL query, keeping
+    # the request well within common web-server request line limits.
+
+    MAX_QUERY_LEN = 4000
+
+    # responses that indicate the request was not processed because the server
+    # is overloaded or unavailable, and can therefore be retried.
+
+    RETRY_STATUS = frozenset({429, 502, 503, 504})
+
+    # a page that still fails with a timeout, or one of these responses that
+    # indicate a slow query, after the request retries is split into smaller
+    # pages, down to MIN_SPLIT_PAGE_SZ items; see `_get_page`.
+
+    SPLIT_STATUS = frozenset({500, 502, 504})
+    MIN_SPLIT_PAGE_SZ = 10
+
+    # the API version that supports the `fields` param to select the fields
+    # of the returned records.
+
+    FIELDS_VERSION = (4, 0)
+
+    # the fields of the brief representation (brief=1) of the endpoints, for
+    # servers that do not support the `fields` param.
+
+    BRIEF_FIELDS = {
+        "/dcim/devices/": frozenset({"id", "url", "name", "display_name"}),
+        "/dcim/interfaces/": frozenset({"id", "url", "device", "name", "cable"}),
+        "/ipam/ip-addresses/": frozenset({"id", "url", "family", "address"}),
+    }
+
+    def __init__(self, **client_options):
+        # the client_options are passed to the httpx AsyncClient, for example
+        # the `transport`.
 
-    def __init__(self):
         try:
             url, token = itemgetter(*NetboxClient.ENV_VARS)(environ)
         except KeyError as exc:
             raise RuntimeError(f"Missing environment variable: {exc.args[0]}")
 
+        self.config = get_source_config(NAME)
+        concurrency = self.config.concurrency or ConcurrencyModel()
+
         super().__init__(
             base_url=f"{url}/api",
             headers=dict(Authorization=f"Token {token}"),
             verify=False,
+            **http_options(self.config.http, max_connections=concurrency.maximum),
+            **client_options,
         )
-        self._api_s4 = asyncio.Semaphore(self.API_RATE_LIMIT)
+        self.retry = self.config.retries or RetryModel()
 
-    async def request(self, *vargs, **kwargs):
-        async with self._api_s4:
-            return await super(NetboxClient, self).request(*vargs, **kwargs)
+        # the GraphQL API is at the server root, rather than below the REST
+        # API base URL; the config may set a different URL.
 
-    async def paginate(
-        self, url: str, page_sz: Optional[int] = None, filters: Optional[Dict] = None
+        self.graphql = self.config.graphql or GraphQLModel()
+        self.graphql_url = self.graphql.url or f"{url}/graphql/"
+
+        # all API requests, reads and writes, share the adaptive concurrency
+        # limiter; see `request`.
+
+        self.limiter = AIMDLimiter(**concurrency.dict())
+
+        # the per-endpoint concurrency budgets, in addition to the limiter.
+        # The first budget that matches the request method and path applies.
+
+        self._budgets = [
+            (
+                {method.upper() for method in budget.methods or []},
+                budget.path,
+                asyncio.Semaphore(budget.limit),
+            )
+            for budget in self.config.budgets or []
+        ]
+        self._no_budget = asyncio.Semaphore(math.inf)
+
+        # the reference data cache, stored on disk per Netbox server when the
+        # config defines a cache directory; see `fetch_refdata`.
+
+        self.refdata = RefDataCache(
+            ttl=(self.config.refdata or RefDataModel()).ttl,
+            directory=get_cache_dir(NAME, "refdata", self.slugify(url)),
+        )
+
+        self._incremental_dir = get_cache_dir(NAME, "incremental", self.slugify(url))
+        self.incremental = self.config.incremental or IncrementalModel()
+
+        # `stats` counts noteworthy API events during the run, for example the
+        # number of retries; reported at the end of each task.
+
+        self.stats = Counter()
+
+        # the GET requests in flight, by URL and the number of writes to the
+        # URL API endpoint when the request was sent; see `request`.
+
+        self._inflight: Dict[Tuple[str, int], asyncio.Future] = dict()
+        self._writes: Dict[str, int] = Counter()
+
+        # the optional GET response cache for the session; see `request`.
+
+        get_cache = self.config.get_cache or GetCacheModel()
+        self.get_cache = (
+            ResponseCache(ttl=get_cache.ttl, max_entries=get_cache.max_entries)
+            if get_cache.enabled
+            else None
+        )
+
+        # the server MAX_PAGE_SIZE setting is not exposed by the API; start with
+        # the Netbox default and lower the value if the server returns fewer
+        # items than requested.
+
+        self.max_page_sz = self.MAX_PAGE_SIZE
+
+        # the server API version, from the API-Version response header.
+
+        self.api_version: Optional[Tuple[int, ...]] = None
+
+        # the paginated response decoders, by record schema.
+
+        self._page_decoders: Dict[Any, Callable] = {None: loads}
+
+    async def request(self, method, url, *vargs, **kwargs):
+        """
+        Send the request; see `_send_request`.  A GET request with the same URL
+        and params as a GET request already in flight is not sent, rather it
+        shares the response of the request in flight (single-flight).  When
+        the GET cache is enabled, a successful GET response is returned from
+        the cache until it expires, or a write to the same API endpoint
+        invalidates it.  A GET request sent after a write to the endpoint does
+        not share the response of a request sent before the write.
+        """
+        if method.upper() != "GET" or kwargs.get("headers"):
+            return await self._send_request(method, url, *vargs, **kwargs)
+
+        key = str(self.build_request(method, url, params=kwargs.get("params")).url)
+
+        if self.get_cache is not None:
+            if (res := self.get_cache.get(key)) is not None:
+                self.stats["cache.hit"] += 1
+                return res
+
+            self.stats["cache.miss"] += 1
+            writes = self.get_cache.writes(self.api_path(url))
+
+        flight_key = (key, self._writes[api_endpoint(self.api_path(url))])
+
+        if (inflight := self._inflight.get(flight_key)) is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(inflight)
+
+        inflight = asyncio.ensure_future(
+            self._send_request(method, url, *vargs, **kwargs)
+        )
+        self._inflight[flight_key] = inflight
+
+        def _done(_task):
+            del self._inflight[flight_key]
+            if _task.cancelled():
+                return
+
+            # retrieve the exception, if any, in case all callers are cancelled.
+            if _task.exception() is None and self.get_cache is not None:
+                if (res := _task.result()).status_code == 200:
+                    self.get_cache.put(key, self.api_path(url), res, writes)
+
+        inflight.add_done_callback(_done)
+
+        # the request is shielded so that cancelling one caller does not
+        # cancel the request shared by the other callers.
+
+        return await asyncio.shield(inflight)
+
+    async def _send_request(self, method, url, *vargs, **kwargs):
+        """
+        Send the request within the endpoint concurrency budget, if any, and
+        the adaptive concurrency limiter, retrying when the server responds
+        with one of the RETRY_STATUS codes or the request fails with a timeout
+        or connection error.  Each retry waits
+        for the server provided Retry-After value, if any, or a jittered
+        exponential backoff.  POST requests are not retried on a timeout,
+        connection error or gateway error since the object may have been
+        created; except GraphQL queries, which are sent with POST.
+        """
+        # a GraphQL query is sent with POST, but does not change any data.
+
+        idempotent = method.upper() != "POST" or str(url) == self.graphql_url
+
+        # encode the JSON request body with the fast codec, if available.
+
+        if (body := kwargs.pop("json", None)) is not None:
+            kwargs["content"] = dumps(body)
+            kwargs["headers"] = dict(kwargs.get("headers") or {}, **JSON_HEADERS)
+        max_retries = self.retry.max_retries
+        budget = self._budget_for(method, url)
+        kind = self._latency_kind(method, url, kwargs.get("params"))
+
+        for attempt in range(max_retries + 1):
+            async with budget:
+                token = await self.limiter.acquire()
+
+                try:
+                    res = await super(NetboxClient, self).request(
+                        method, url, *vargs, **kwargs
+                    )
+
+                except (TimeoutException, TransportError) as exc:
+                    self.limiter.release(token, key=kind, ok=False)
+                    if not idempotent or attempt == max_retries:
+                        raise
+
+                    reason, delay = exc.__class__.__name__, None
+
+                except BaseException:
+                    self.limiter.release(token, key=kind, ok=None)
+                    raise
+
+                else:
+                    status = res.status_code
+                    if self.api_version is None and "API-Version" in res.headers:
+                        self.api_version = _parse_version(res.headers["API-Version"])
+
+                    self.limiter.release(
+                        token, key=kind, ok=status < 500 and status != 429
+                    )
+
+                    if method.upper() != "GET" and not res.is_error:
+                        self._writes[api_endpoint(self.api_path(url))] += 1
+                        self.refdata.invalidate(self.api_path(url))
+                        if self.get_cache is not None:
+                            self.get_cache.invalidate(self.api_path(url))
+
+                    if status not in self.RETRY_STATUS or attempt == max_retries:
+                        return res
+
+                    if not idempotent and status not in (429, 503):
+                        return res
+
+                    reason, delay = str(status), _retry_after(res)
+
+            self.stats["retries"] += 1
+            self.stats[f"retries.{reason}"] += 1
+
+            if delay is None:
+                delay = random.uniform(
+                    0, min(self.retry.backoff_max, self.retry.backoff * 2**attempt)
+                )
+
+            await asyncio.sleep(delay)
+
+    def _latency_kind(self, method: str, url, params) -> Tuple:
+        """
+        Return the kind of request, for the limiter latency baseline: the
+        method, the API endpoint, and the page size, if any.  A page of 1000
+        records takes longer than a single record lookup on a healthy server,
+        so their latencies are not compared with each other.
+        """
+        limit = QueryParams(params).get("limit") if params else None
+        return method.upper(), api_endpoint(self.api_path(url)), limit
+
+    def _budget_for(self, method: str, url) -> asyncio.Semaphore:
+        """
+        Return the concurrency budget semaphore for the request method and
+        URL.  The URL path, relative to the API base URL, is matched against
+        the budget path pattern, for example "/dcim/interfaces/*".
+        """
+        method = method.upper()
+        path = self.api_path(url)
+
+        return next(
+            (
+                sema4
+                for methods, pattern, sema4 in self._budgets
+                if (not methods or method in methods) and fnmatchcase(path, pattern)
+            ),
+            self._no_budget,
+        )
+
+    def api_path(self, url) -> str:
+        """
+        Return the URL path relative to the API base URL, with a leading
+        slash; for example "/dcim/interfaces/12/".
+        """
+        path = URL(str(url)).path
+        base_path = self.base_url.path.rstrip("/")
+
+        if path.startswith(base_path + "/"):
+            path = path[len(base_path) :]
+
+        return "/" + path.lstrip("/")
+
+    async def projection(self, url: str, fields: Optional[Iterable[str]]) -> Dict:
+        """
+        Return the API params that select the slimmest representation of the
+        url records that includes the given fields, for example
+        {"fields": "description,device,id,name"}.  The `fields` param is used
+        when the server supports it, otherwise `brief` is used when the brief
+        representation includes the fields.  If neither, the full
+        representation is used and the return value is empty.
+        """
+        if not fields:
+            return {}
+
+        fields = set(fields) | {"id"}
+
+        if self.api_version is None:
+            await self.get("/")
+            self.api_version = self.api_version or ()
+
+        if self.api_version >= self.FIELDS_VERSION:
+            return {"fields": ",".join(sorted(fields))}
+
+        if fields <= self.BRIEF_FIELDS.get(url, frozenset()):
+            return {"brief": 1}
+
+        return {}
+
+    async def graphql_query(self, query: str, variables: Optional[Dict] = None):
+        """
+        Send the GraphQL query and return the response "data" value.  Raises
+        RuntimeError if the response includes errors.
+        """
+        res = await self.post(
+            self.graphql_url, json=dict(query=query, variables=variables or {})
+        )
+        res.raise_for_status()
+        body = loads(res.content)
+
+        if errors := body.get("errors"):
+            raise RuntimeError(
+                "Netbox GraphQL errors: "
+                + "; ".join(err.get("message", str(err)) for err in errors)
+            )
+
+        return body["data"]
+
+    async def fetch_refdata(self, url: str, filters: Optional[Dict] = None):
+        """
+        Return all of the records for the reference data URL, for example
+        "/dcim/device-types/", using the reference data cache.  A write to the
+        URL by this client invalidates the cache entries.
+        """
+        return await self.refdata.get(
+            url, filters, lambda: self.paginate(url, filters=filters)
+        )
+
+    async def paginate_incremental(
+        self, url: str, filters: Optional[Dict] = None, schema: Optional[Any] = None
     ) -> List[Dict]:
         """
-        Concurrently paginate GET on url for the given page_sz and optional
-        Caller filters (Netbox API specific).  Return the list of all page
-        results.
+        Return all of the records for the url and filters, using the local copy
+        of the records from a prior run and fetching only the records changed
+        since then; that is `last_updated__gte` the stored watermark.  A full
+        fetch is done when there is no local copy, or when the last full fetch
+        is older than the configured `reconcile` interval so that deleted
+        records are removed.
+
+        If the config does not define a cache directory, then all records are
+        fetched.  The optional record `schema` is described in `paginate_iter`;
+        it must include the "id" and "last_updated" fields.
+        """
+        if self._incremental_dir is None:
+            return await self.paginate(url, filters=filters, schema=schema)
+
+        store = IncrementalStore(
+            self._incremental_dir,
+            url,
+            filters,
+            fields=schema and sorted(get_type_hints(schema)),
+        )
+
+        if (
+            not store.load()
+            or not store.watermark
+            or store.reconcile_due(self.incremental.reconcile)
+        ):
+            store.replace(await self.paginate(url, filters=filters, schema=schema))
+            self.stats["incremental.full"] += 1
+
+        else:
+            changed = await self.paginate(
+                url,
+                filters=dict(filters or {}, last_updated__gte=store.watermark),
+                schema=schema,
+            )
+            store.merge(changed)
+            self.stats["incremental.changed"] += len(changed)
+
+        store.save()
+        return list(store.records.values())
+
+    def paginate_iter(
+        self,
+        url: str,
+        page_sz: Optional[int] = None,
+        filters: Optional[Dict] = None,
+        prefetch: Optional[int] = None,
+        keyset: Optional[bool] = False,
+        schema: Optional[Any] = None,
+    ) -> AsyncIterator[Dict]:
+        """
+        Paginate GET on url for the given page_sz and optional Caller filters
+        (Netbox API specific), yielding each record as the pages arrive.  At
+        most `prefetch` page requests are in flight at any time so that the
+        memory used is bounded by the window size rather than the size of the
+        table.
+
+        The first page is fetched on its own and provides the total count.  If
+        the Caller does not provide a page_sz, then the remaining pages are
+        sized from that count, up to MAX_PAGE_SIZE, so that small queries cost
+        a single request and large queries use fewer, larger pages.
 
         Parameters
         ----------
@@ -50,47 +467,310 @@ class NetboxClient(AsyncClient):
             The Netbox API URL endpoint
 
         page_sz:
-            Max number of result items
+            Max number of result items per page
 
         filters:
             The Netbox API params filter options.
 
-        Returns
-        -------
-        List of all Netbox API results from all pages
+        prefetch:
+            Max number of pages fetched concurrently ahead of the Caller.
+
+        keyset:
+            When True, walk the records by id (id__gt) rather than by offset;
+            see `_paginate_keyset`.
+
+        schema:
+            The record schema, for example a TypedDict, used to decode only the
+            record fields in the schema; see `codec.projected_decoder`.  The
+            schema must include the "id" field when keyset is True.
+
+        Yields
+        ------
+        Each Netbox API result record; in page order when using offsets.
         """
+        params = dict(filters or {})
+        prefetch = prefetch or self.DEFAULT_PREFETCH
+        paginator = self._paginate_keyset if keyset else self._paginate_offset
+        return paginator(
+            url,
+            page_sz=page_sz,
+            params=params,
+            prefetch=prefetch,
+            decode=self._page_decoder(schema),
+        )
+
+    def _page_decoder(self, schema) -> Callable:
+        """return the decoder for the paginated responses of schema records"""
+        if (decode := self._page_decoders.get(schema)) is None:
+            page_schema = TypedDict(
+                f"{schema.__name__}Page", {"count": int, "results": List[schema]}
+            )
+            decode = self._page_decoders[schema] = projected_decoder(page_schema)
 
-        # GET the url for limit = 1 record just to determin the total number of
-        # items.
+        return decode
 
-        params = filters or {}
-        params["limit"] = 1
+    async def _paginate_offset(
+        self,
+        url: str,
+        page_sz: Optional[int],
+        params: Dict,
+        prefetch: int,
+        decode: Callable = loads,
+    ) -> AsyncIterator[Dict]:
+        """Paginate using limit/offset; see `paginate_iter`."""
 
-        res = await self.get(url, params=params)
-        res.raise_for_status()
-        body = res.json()
+        def _get_page(offset, limit, server_limit=None):
+            # NOTE: each request _MUST_ be given its own params dict to ensure
+            # that each task has a unique offset value.
+            page_params = dict(params, offset=offset, limit=limit)
+            task = asyncio.create_task(self._get_page(url, page_params, decode))
+            return offset, limit, server_limit, task
+
+        # the first page determines the total number of items.
+
+        first_limit = min(page_sz or self.DEFAULT_PAGE_SZ, self.max_page_sz)
+        window = deque([_get_page(0, first_limit)])
+        offsets = iter(())
+        count = None
+
+        def _schedule_next():
+            if (offset := next(offsets, None)) is not None:
+                window.append(_get_page(offset, limit))
+
+        try:
+            while window:
+                offset, req_limit, server_limit, task = window.popleft()
+                body = await task
+                results = body["results"]
+                got = offset + len(results)
+
+                # the remainder of a short page has records, so the short page
+                # was the server MAX_PAGE_SIZE rather than records deleted
+                # during the walk; remember the server limit.
+
+                if server_limit is not None and results:
+                    self.max_page_sz = min(self.max_page_sz, server_limit)
+
+                if count is None:
+                    count = body["count"]
+                    limit = page_sz or self._page_sz_for(count - got, prefetch)
+                    limit = min(limit, self.max_page_sz)
+                    offsets = iter(range(got, count, limit))
+                    for _ in range(prefetch):
+                        _schedule_next()
+
+                # an empty page means that the table shrank during the walk,
+                # for example records were deleted, so there are no records at
+                # or after this offset.
+
+                elif not results:
+                    break
+
+                # if the server returned fewer items than requested, and this
+                # is not the last page, then either the server has a smaller
+                # MAX_PAGE_SIZE than requested or the table shrank.  Fetch the
+                # remainder of this page next.
+
+                elif len(results) < req_limit and got < count:
+                    window.appendleft(
+                        _get_page(got, req_limit - len(results), len(results))
+                    )
+
+                else:
+                    _schedule_next()
+
+                for rec in results:
+                    yield rec
+
+        finally:
+            # if the Caller stops consuming early, or a page fails, then cancel
+            # any pages that remain in-flight.
+            for *_, task in window:
+                task.cancel()
+
+    async def _paginate_keyset(
+        self,
+        url: str,
+        page_sz: Optional[int],
+        params: Dict,
+        prefetch: int,
+        decode: Callable = loads,
+    ) -> AsyncIterator[Dict]:
+        """
+        Paginate using keyset (id__gt) pagination; see `paginate_iter`.  Deep
+        OFFSET values get slower with every page on a large table, whereas an
+        id__gt lookup uses the primary key index.
+
+        The first page, ordered by id, provides the total count and the lowest
+        ids.  The remaining id range, up to the largest id, is split into
+        shards that are each walked by id so that the shards can be fetched
+        concurrently.  Records are yielded in the order the pages arrive.
+        """
+        params["ordering"] = "id"
+
+        # the first page is requested at the max page size so that a server
+        # MAX_PAGE_SIZE lower than ours is detected before the shards are
+        # walked; a short page is the end-of-shard condition.
+
+        limit = min(page_sz or self.max_page_sz, self.max_page_sz)
+        body = await self._get_page(url, dict(params, limit=limit), decode)
+        results = body["results"]
         count = body["count"]
 
-        # create a list of tasks to run concurrently to fetch the data in pages.
-        # NOTE: that we _MUST_ do a params.copy() to ensure that each task has a
-        # unique offset count.  Observed that if copy not used then all tasks have
-        # the same (last) value.
+        ids = [rec["id"] for rec in results]
+        if ids != sorted(ids):
+            get_logger().warning(
+                f"Netbox {url}: ordering by id not supported, using offset pagination"
+            )
+            params.pop("ordering")
+            async for rec in self._paginate_offset(
+                url, page_sz, params, prefetch, decode
+            ):
+                yield rec
+            return
+
+        for rec in results:
+            yield rec
+
+        if not results or len(results) == count:
+            return
 
-        params["limit"] = page_sz or self.DEFAULT_PAGE_SZ
-        tasks = list()
+        if len(results) < limit:
+            self.max_page_sz = limit = len(results)
+
+        # find the largest id, and split the remaining id range into shards.
+        # Records may be deleted during the walk, leaving none after the first
+        # page.
+
+        res = await self.get(url, params=dict(params, ordering="-id", limit=1))
+        res.raise_for_status()
+        last_page, last_id = decode(res.content)["results"], ids[-1]
+        if not last_page or (max_id := last_page[0]["id"]) <= last_id:
+            return
 
-        for offset in range(0, count, params["limit"]):
-            params["offset"] = offset
-            tasks.append(self.get(url, params=params.copy()))
+        n_shards = min(prefetch, -(-(count - len(results)) // limit))
+        shard_sz = -(-(max_id - last_id) // n_shards)
 
-        task_results = await asyncio.gather(*tasks)
+        def _get_page(cursor, shard_hi):
+            page_params = dict(params, limit=limit, id__gt=cursor, id__lte=shard_hi)
+            return asyncio.create_task(self._get_page(url, page_params, decode))
 
-        # return the flattened list of results
+        pending = {
+            _get_page(lo, min(lo + shard_sz, max_id)): min(lo + shard_sz, max_id)
+            for lo in range(last_id, max_id, shard_sz)
+        }
 
-        return list(
-            chain.from_iterable(task_r.json()["results"] for task_r in task_results)
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    shard_hi = pending.pop(task)
+                    results = task.result()["results"]
+
+                    if len(results) == limit and results[-1]["id"] < shard_hi:
+                        pending[_get_page(results[-1]["id"], shard_hi)] = shard_hi
+
+                    for rec in results:
+                        yield rec
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _get_page(self, url: str, params: Dict, decode: Callable) -> Dict:
+        """
+        GET the page for the params, with either the `offset` or the `id__gt`
+        cursor, and return the decoded response body.  The request itself is
+        retried; see `request`.  If the request then still fails with a
+        timeout or one of the SPLIT_STATUS responses, the page is split in two
+        halves that are each fetched, and split, on their own.  The halves are
+        combined so that the Caller gets the same body as for the page, or a
+        short page when the first half is short.
+        """
+        limit = params["limit"]
+
+        try:
+            res = await self.get(url, params=params)
+            if res.status_code not in self.SPLIT_STATUS or limit < 2:
+                res.raise_for_status()
+                return decode(res.content)
+
+            failure = HTTPStatusError(
+                f"Netbox {url}: status {res.status_code}",
+                request=res.request,
+                response=res,
+            )
+
+        except TimeoutException as exc:
+            failure = exc
+
+        half = limit // 2
+        if half < self.MIN_SPLIT_PAGE_SZ:
+            raise failure
+
+        self.stats["page_splits"] += 1
+
+        # the second half starts after the first half, that is at the offset
+        # or after the last id of the first half.  If the first half is short,
+        # for example a server MAX_PAGE_SIZE below `half`, then it is returned
+        # alone and the Caller fetches the remainder.
+
+        first = await self._get_page(url, dict(params, limit=half), decode)
+        if len(first["results"]) < half:
+            return first
+
+        if "offset" in params:
+            cursor = dict(offset=params["offset"] + half)
+        else:
+            cursor = dict(id__gt=first["results"][-1]["id"])
+
+        second = await self._get_page(
+            url, dict(params, **cursor, limit=limit - half), decode
+        )
+        return dict(first, results=first["results"] + second["results"])
+
+    def _page_sz_for(self, remaining: int, prefetch: int) -> int:
+        """
+        Return the page size for the `remaining` number of items so that they
+        are spread across the prefetch window, bounded by the default page
+        size and MAX_PAGE_SIZE.
+        """
+        return max(
+            self.DEFAULT_PAGE_SZ, min(self.MAX_PAGE_SIZE, -(-remaining // prefetch))
         )
 
+    async def paginate(
+        self,
+        url: str,
+        page_sz: Optional[int] = None,
+        filters: Optional[Dict] = None,
+        prefetch: Optional[int] = None,
+        keyset: Optional[bool] = False,
+        schema: Optional[Any] = None,
+    ) -> List[Dict]:
+        """
+        Paginate GET on url for the given page_sz and optional Caller filters
+        (Netbox API specific).  Return the list of all page results.  See
+        `paginate_iter` for parameter details.
+
+        Returns
+        -------
+        List of all Netbox API results from all pages
+        """
+        return [
+            rec
+            async for rec in self.paginate_iter(
+                url,
+                page_sz=page_sz,
+                filters=filters,
+                prefetch=prefetch,
+                keyset=keyset,
+                schema=schema,
+            )
+        ]
+
     # -------------------------------------------------------------------------
     #
     #                        Device Helper Methods
@@ -100,11 +780,26 @@ class NetboxClient(AsyncClient):
     async def fetch_device(self, hostname):
         res = await self.get("/dcim/devices/", params=dict(name=hostname))
         res.raise_for_status()
-        body = res.json()
+        body = loads(res.content)
         return [] if not body["count"] else body["results"]
 
-    async def fetch_devices(self, hostname_list, key=None):
-        res = await asyncio.gather(*(map(self.fetch_device, hostname_list)))
+    async def fetch_devices(self, hostname_list, key=None, fields=None):
+        """
+        Fetch the device records for the given hostnames.  The hostnames are
+        grouped into multi-value `name` filters so that each request fetches
+        many devices, bounded by MAX_QUERY_LEN.  If given, only the `fields`
+        of the records are fetched, when supported by the server.
+        """
+        hostname_list = set(hostname_list)
+        chunks = self.chunk_query(hostname_list, lambda name: _query_len(name=name))
+        params = await self.projection("/dcim/devices/", fields)
+
+        res = await asyncio.gather(
+            *(
+                self.paginate("/dcim/devices/", filters=dict(params, name=chunk))
+                for chunk in chunks
+            )
+        )
         flat = chain.from_iterable(res)
         if not key:
             return list(flat)
@@ -123,18 +818,74 @@ class NetboxClient(AsyncClient):
             "/dcim/interfaces/", params=dict(device=hostname, name=if_name)
         )
         res.raise_for_status()
-        body = res.json()
+        body = loads(res.content)
         return [] if not body["count"] else body["results"]
 
-    async def fetch_devices_interfaces(self, items, key=None):
-        res = await asyncio.gather(*(starmap(self.fetch_device_interface, items)))
-        flat = chain.from_iterable(res)
+    async def fetch_devices_interfaces(self, items, key=None, fields=None):
+        """
+        Fetch the interface records for the given (hostname, if_name) items.
+        The items are grouped into multi-value `device` and `name` filters,
+        bounded by MAX_QUERY_LEN.  Since Netbox matches any device with any
+        name, the results are filtered to the requested items.  If given, only
+        the `fields` of the records are fetched, when supported by the server;
+        the "device" and "name" fields are always included.
+        """
+        items = set(items)
+        chunks = self.chunk_query(
+            items, lambda item: _query_len(device=item[0], name=item[1])
+        )
+        params = await self.projection(
+            "/dcim/interfaces/", fields and {"device", "name", *fields}
+        )
+
+        def _chunk_filters(chunk):
+            hostnames, if_names = zip(*chunk)
+            return dict(
+                params, device=sorted(set(hostnames)), name=sorted(set(if_names))
+            )
+
+        res = await asyncio.gather(
+            *(
+                self.paginate("/dcim/interfaces/", filters=_chunk_filters(chunk))
+                for chunk in chunks
+            )
+        )
+        # the same record may be returned by more than one chunk; use the
+        # record id to remove the duplicates.
+
+        flat = {
+            rec["id"]: rec
+            for rec in chain.from_iterable(res)
+            if (rec["device"]["name"], rec["name"]) in items
+        }.values()
         if not key:
             return list(flat)
 
         key_fn = key if isinstance(key, Callable) else itemgetter(key)  # noqa
         return {key_fn(rec): rec for rec in flat}
 
+    def chunk_query(
+        self, values: Iterable, query_len: Callable[[Any], int]
+    ) -> Iterator[List]:
+        """
+        Group the values into lists such that the URL query length, as
+        determined by the `query_len` function for each value, does not exceed
+        MAX_QUERY_LEN.
+        """
+        chunk, chunk_len = list(), 0
+
+        for value in values:
+            value_len = query_len(value)
+            if chunk and chunk_len + value_len > self.MAX_QUERY_LEN:
+                yield chunk
+                chunk, chunk_len = list(), 0
+
+            chunk.append(value)
+            chunk_len += value_len
+
+        if chunk:
+            yield chunk
+
     @staticmethod
     def slugify(value, allow_unicode=False):
         """
@@ -156,6 +907,130 @@ class NetboxClient(AsyncClient):
         return re.sub(r"[-\s]+", "-", value)
 
 
+def _retry_after(res: Response) -> Optional[float]:
+    """return the Retry-After header value in seconds, if provided"""
+    if (value := res.headers.get("Retry-After")) is None:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _parse_version(value: str) -> Tuple[int, ...]:
+    """return the API-Version header value, for example "3.7", as a tuple"""
+    try:
+        return tuple(int(part) for part in value.split("."))
+    except ValueError:
+        return ()
+
+
+def _query_len(**params) -> int:
+    """return the URL encoded length of the params, including the separator"""
+    return len(urlencode(params)) + 1
+
+
 class NetboxSource(Source):
     name = NAME
     client_class = NetboxClient
+
+    # max number of objects in a single bulk request body.
+
+    BULK_SIZE = 100
+
+    @property
+    def update_limit(self) -> int:
+        # the client concurrency limiter determines the number of requests in
+        # flight; do not limit the updates below the limiter maximum.
+        return self.client.limiter.maximum
+
+    async def update_bulk(
+        self,
+        updates: Dict,
+        callback: Optional[Callable],
+        creator: Callable[[Any, Any], Optional[Dict]],
+        url: str,
+        method: Optional[str] = "POST",
+    ):
+        """
+        Bulk form of `Source.update` using the Netbox list-body endpoints.  The
+        `creator` function returns the request body item for each update,
+        rather than a coroutine, or None to skip the update.  The items are
+        sent in chunks of BULK_SIZE and the `callback` is called for each
+        update with a Response for that item.
+
+        Netbox processes a bulk request as a single transaction, so if a chunk
+        fails, it is split in half and each half is retried until the failing
+        items are isolated; each of those is reported with its own error
+        response.
+
+        Parameters
+        ----------
+        updates:
+            The dict of updates, key=<collection-key>, value=<fields>
+
+        callback:
+            Called with ((key, value), Response) for each update item
+
+        creator:
+            Returns the request body item for (key, value)
+
+        url:
+            The Netbox API endpoint URL, for example "/dcim/interfaces/"
+
+        method:
+            One of "POST" (create), "PATCH" (update), or "DELETE".  The PATCH
+            and DELETE body items must include the object "id".
+        """
+        callback = callback or (lambda _k, _t: True)
+        items = list()
+
+        for key, value in updates.items():
+            if (payload := creator(key, value)) is None:
+                continue
+
+            items.append(((key, value), payload))
+
+        async def _send(chunk):
+            res = await self.client.request(
+                method, url, json=[payload for _, payload in chunk]
+            )
+
+            if res.is_error and len(chunk) > 1:
+                half = len(chunk) // 2
+                await asyncio.gather(_send(chunk[:half]), _send(chunk[half:]))
+                return
+
+            # the response body is the list of objects in the same order as
+            # the request body; DELETE has no response body.
+
+            if res.is_error or not res.content:
+                for item, _ in chunk:
+                    callback(item, res)
+                return
+
+            for (item, _), rec in zip(chunk, loads(res.content)):
+                callback(
+                    item,
+                    Response(
+                        res.status_code,
+                        content=dumps(rec),
+                        headers=JSON_HEADERS,
+                        request=res.request,
+                    ),
+                )
+
+        chunks = (
+            items[offset : offset + self.BULK_SIZE]
+            for offset in range(0, len(items), self.BULK_SIZE)
+        )
+
+        await iawait(map(_send, chunks), limit=self.update_limit)
@@ -0,0 +1,89 @@
+# -----------------------------------------------------------------------------
+# System Imports
+# -----------------------------------------------------------------------------
+
+from typing import Dict, Optional, Iterable
+from contextlib import AsyncExitStack
+from contextvars import ContextVar
+
+# -----------------------------------------------------------------------------
+# Private Imports
+# -----------------------------------------------------------------------------
+
+from ipf_netbox.source import Source, get_source
+
+# -----------------------------------------------------------------------------
+# Exports
+# -----------------------------------------------------------------------------
+
+__all__ = ["Session", "get_session"]
+
+
+# -----------------------------------------------------------------------------
+#
+#                              CODE BEGINS
+#
+# -----------------------------------------------------------------------------
+
+g_session: ContextVar[Optional["Session"]] = ContextVar("session", default=None)
+
+
+class Session(object):
+    """
+    A Session owns one Source instance, and therefore one API client, for
+    each source name.  The clients are opened when the session is entered,
+    and closed when the session exits.  While the session is active, the
+    tasks use the session sources rather than creating their own, so that a
+    series of tasks reuse the same connections and IP Fabric login; for
+    example:
+
+        async with Session():
+            await ensure_devices(**params)
+            await ensure_interfaces(**params)
+
+    Parameters
+    ----------
+    names:
+        The source names.
+    """
+
+    NAMES = ("netbox", "ipfabric")
+
+    # the API client request timeout, in seconds.
+
+    TIMEOUT = 120
+
+    def __init__(self, names: Optional[Iterable[str]] = None):
+        self.sources: Dict[str, Source] = {
+            name: get_source(name) for name in (names or self.NAMES)
+        }
+        self._exit_stack: Optional[AsyncExitStack] = None
+        self._token = None
+
+    def get_source(self, name: str) -> Source:
+        try:
+            return self.sources[name]
+        except KeyError:
+            raise RuntimeError(f"NOT-FOUND: Session source name: {name}")
+
+    async def __aenter__(self) -> "Session":
+        self._exit_stack = AsyncExitStack()
+
+        for source in self.sources.values():
+            await self._exit_stack.enter_async_context(source.client)
+
+            # the IP Fabric client uses an API session attribute.
+            client = getattr(source.client, "api", source.client)
+            client.timeout = self.TIMEOUT
+
+        self._token = g_session.set(self)
+        return self
+
+    async def __aexit__(self, *exc_info):
+        g_session.reset(self._token)
+        await self._exit_stack.__aexit__(*exc_info)
+
+
+def get_session() -> Optional[Session]:
+    """return the active session, or None"""
+    return g_session.get()
@@ -1,19 +1,29 @@
 from abc import ABC
-from typing import Coroutine
+from typing import Coroutine, Dict, Optional
 
-from .igather import igather
+from httpx import Limits
 
+from .igather import igather
+from .config import HttpModel
 
-__all__ = ["Source", "get_source"]
+__all__ = ["Source", "get_source", "http_options"]
 
 
 class Source(ABC):
     name = None
     client_class = None
 
+    # max number of update coroutines run concurrently by `update`.
+
+    UPDATE_LIMIT = 100
+
     def __init__(self):
         self.client = self.client_class()
 
+    @property
+    def update_limit(self) -> int:
+        return self.UPDATE_LIMIT
+
     @classmethod
     def get_source(cls, name):
         try:
@@ -26,8 +36,7 @@ class Source(ABC):
 
         return s_cls()
 
-    @staticmethod
-    async def update(updates, callback, creator):
+    async def update(self, updates, callback, creator):
 
         tasks = dict()
         callback = callback or (lambda _k, _t: True)
@@ -41,9 +50,34 @@ class Source(ABC):
 
             tasks[coro] = (key, value)
 
-        async for orig_coro, res in igather(tasks, limit=100):
+        async for orig_coro, res in igather(tasks, limit=self.update_limit):
             item = tasks[orig_coro]
             callback(item, res)
 
 
 get_source = Source.get_source
+
+
+def http_options(config: Optional[HttpModel], max_connections: int) -> Dict:
+    """
+    Return the httpx client, or transport, connection pool and HTTP/2 options
+    for the source `http` config.  The `max_connections` value is used when
+    not set by the config; it should be no less than the number of concurrent
+    requests so that requests do not wait for (and timeout on) a connection.
+    By default all connections are kept alive.
+    """
+    config = config or HttpModel()
+    max_connections = config.max_connections or max_connections
+
+    return dict(
+        limits=Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=(
+                config.max_keepalive_connections
+                if config.max_keepalive_connections is not None
+                else max_connections
+            ),
+            keepalive_expiry=config.keepalive_expiry,
+        ),
+        http2=config.http2,
+    )
@@ -20,8 +20,9 @@ from ipf_netbox.collection import get_collection
 from ipf_netbox.diff import diff, DiffResults
 from ipf_netbox.netbox.devices import NetboxDeviceCollection
 from ipf_netbox.ipfabric.devices import IPFabricDeviceCollection
+from ipf_netbox.ipfabric.filters import F
 from ipf_netbox.tasks.tasktools import with_sources
-
+from ipf_netbox.codec import loads
 
 # -----------------------------------------------------------------------------
 #
@@ -167,7 +168,9 @@ async def _ensure_primary_ipaddrs(
     await asyncio.gather(
         *(
             ipf_col_ipaddrs.fetch(
-                filters=f"and(hostname = {_item['hostname']}, ip = '{_item['loginIp']}')"
+                filters=F.and_(
+                    F.hostname == _item["hostname"], F.ip == _item["loginIp"]
+                )
             )
             for _item in [ipf_col.source_record_keys[key] for key in missing.keys()]
         )
@@ -183,7 +186,9 @@ async def _ensure_primary_ipaddrs(
     await asyncio.gather(
         *(
             ipf_col_ifaces.fetch(
-                filters=f"and(hostname = {_item['hostname']}, intName = {_item['intName']})"
+                filters=F.and_(
+                    F.hostname == _item["hostname"], F.intName == _item["intName"]
+                )
             )
             for _item in ipf_col_ipaddrs.source_record_keys.values()
         )
@@ -218,7 +223,7 @@ async def _ensure_primary_ipaddrs(
             return
 
         print(f"CREATE:OK: interface {hname}, {iname}.")
-        nb_col_ifaces.source_records.append(_res.json())
+        nb_col_ifaces.source_records.append(loads(_res.content))
 
     def _report_ipaddr(item, _res: Response):
         _key, _fields = item
@@ -233,7 +238,7 @@ async def _ensure_primary_ipaddrs(
             print(f"CREATE:FAIL: {ident}: {_res.text}")
             return
 
-        nb_col_ipaddrs.source_records.append(_res.json())
+        nb_col_ipaddrs.source_records.append(loads(_res.content))
         print(f"CREATE:OK: {ident}.")
 
     if diff_ifaces:
@@ -275,7 +280,7 @@ async def _execute_create(
             return
 
         print(f"CREATE:OK: device {item['hostname']} ... creating primary IP ... ")
-        nb_col.source_records.append(_res.json())
+        nb_col.source_records.append(loads(_res.content))
 
     await nb_col.create_missing(missing=missing, callback=_report_device)
     await _ensure_primary_ipaddrs(ipf_col=ipf_col, nb_col=nb_col, missing=missing)
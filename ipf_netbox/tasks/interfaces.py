@@ -9,6 +9,7 @@ from ipf_netbox.diff import diff
 from ipf_netbox.tasks.tasktools import with_sources
 from ipf_netbox.ipfabric.interfaces import IPFabricInterfaceCollection
 from ipf_netbox.netbox.interfaces import NetboxInterfaceCollection
+from ipf_netbox.netbox.graphql import fetch_collections
 
 
 @with_sources
@@ -59,14 +60,8 @@ async def ensure_interfaces(ipf, nb, **params) -> List[str]:
         # if provided device collection, then use that device list to find the
         # associated interfaces.
 
-        print(f"{len(ipf_device_list)} devices ... ", flush=True, end="")
-
-        await asyncio.gather(
-            *(
-                ipf_col.fetch(filters=f"hostname = {hostname}")
-                for hostname in ipf_device_list
-            )
-        )
+        strategy = await ipf_col.fetch_scope(ipf_device_list)
+        print(f"{strategy} ... ", flush=True, end="")
 
     else:
         raise RuntimeError("FAIL: no parameters to fetch interfaces")
@@ -78,7 +73,7 @@ async def ensure_interfaces(ipf, nb, **params) -> List[str]:
         return []
 
     # create the IPF hostname specific device list for return purposes.
-    ipf_device_list = [rec["hostname"] for rec in ipf_col.source_records]
+    ipf_device_list = [rec["hostname"] for rec in ipf_col.source_record_keys.values()]
 
     # -------------------------------------------------------------------------
     # Need to fetch interfaces from Netbox on a per-device basis.
@@ -94,9 +89,14 @@ async def ensure_interfaces(ipf, nb, **params) -> List[str]:
     print(f"{len(col_device_list)} devices ... ", flush=True, end="")
 
     nb.client.timeout = 120
-    await asyncio.gather(
-        *(nb_col.fetch(hostname=hostname) for hostname in col_device_list)
-    )
+
+    if nb.client.graphql.enabled:
+        await fetch_collections(nb, col_device_list, interfaces=nb_col)
+    else:
+        strategy = await nb_col.fetch_scope(
+            {rec["hostname"]: rec["site"] for rec in ipf_col.inventory.values()}
+        )
+        print(f"({strategy}) ... ", flush=True, end="")
 
     nb_col.make_keys()
     print(f"{len(nb_col)} items.", flush=True)
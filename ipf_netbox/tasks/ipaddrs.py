@@ -9,6 +9,7 @@ from ipf_netbox.diff import diff, DiffResults
 from ipf_netbox.tasks.tasktools import with_sources
 from ipf_netbox.ipfabric.ipaddrs import IPFabricIPAddrCollection
 from ipf_netbox.netbox.ipaddrs import NetboxIPAddrCollection
+from ipf_netbox.netbox.graphql import fetch_collections
 
 
 @with_sources
@@ -53,14 +54,8 @@ async def ensure_ipaddrs(ipf, nb, **params) -> List[str]:
 
     elif (ipf_device_list := params.get("devices")) is not None:
 
-        print(f"{len(ipf_device_list)} devices ... ", flush=True, end="")
-
-        await asyncio.gather(
-            *(
-                ipf_col.fetch(filters=f"hostname = {hostname}")
-                for hostname in ipf_device_list
-            )
-        )
+        strategy = await ipf_col.fetch_scope(ipf_device_list)
+        print(f"{strategy} ... ", flush=True, end="")
 
     else:
         raise RuntimeError("FAIL: No parameters to fetch ipaddrs")
@@ -68,11 +63,11 @@ async def ensure_ipaddrs(ipf, nb, **params) -> List[str]:
     ipf_col.make_keys()
     print(f"{len(ipf_col)} items.")
 
-    if not len(ipf_col.source_records):
+    if not len(ipf_col):
         return []
 
     # create the IPF hostname specific device list for return purposes.
-    ipf_device_list = [rec["hostname"] for rec in ipf_col.source_records]
+    ipf_device_list = [rec["hostname"] for rec in ipf_col.source_record_keys.values()]
 
     # -------------------------------------------------------------------------
     # Need to fetch from Netbox on a per-device basis.
@@ -86,9 +81,14 @@ async def ensure_ipaddrs(ipf, nb, **params) -> List[str]:
     print(f"{len(col_device_list)} devices ... ", flush=True, end="")
 
     nb.client.timeout = 120
-    await asyncio.gather(
-        *(nb_col.fetch(hostname=hostname) for hostname in col_device_list)
-    )
+
+    if nb.client.graphql.enabled:
+        await fetch_collections(nb, col_device_list, ipaddrs=nb_col)
+    else:
+        strategy = await nb_col.fetch_scope(
+            {rec["hostname"]: rec["site"] for rec in ipf_col.inventory.values()}
+        )
+        print(f"({strategy}) ... ", flush=True, end="")
 
     nb_col.make_keys()
     print(f"{len(nb_col)} items.", flush=True)
@@ -143,7 +143,8 @@ async def _diff_create(nb_col: NetboxIPAddrCollection, missing):
             f"ipaddr {_fields['hostname']}, {_fields['interface']}, {_fields['ipaddr']}"
         )
         print(
-            f"CREATE:OK: {ident}", flush=True,
+            f"CREATE:OK: {ident}",
+            flush=True,
         )
 
     await nb_col.create_missing(missing, callback=_done)
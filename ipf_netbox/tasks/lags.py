@@ -9,7 +9,7 @@ from ipf_netbox.diff import diff
 from ipf_netbox.tasks.tasktools import with_sources, diff_report_brief
 from ipf_netbox.ipfabric.portchans import IPFabricPortChannelCollection
 from ipf_netbox.netbox.portchans import NetboxPortChanCollection
-from ipf_netbox.igather import iawait
+from ipf_netbox.netbox.graphql import fetch_collections
 
 # -----------------------------------------------------------------------------
 #
@@ -40,15 +40,8 @@ async def ensure_lags(ipf, nb, **params) -> Set[str]:
         # if provided device collection, then use that device list to find the
         # associated port-channels
 
-        print(f"{len(ipf_device_list)} devices ... ", flush=True, end="")
-
-        await iawait(
-            (
-                ipf_col_pc.fetch(filters=f"hostname = {hostname}")
-                for hostname in ipf_device_list
-            ),
-            limit=100,
-        )
+        strategy = await ipf_col_pc.fetch_scope(ipf_device_list)
+        print(f"{strategy} ... ", flush=True, end="")
 
     else:
         raise RuntimeError("Request lag parameters missing.")
@@ -63,9 +56,12 @@ async def ensure_lags(ipf, nb, **params) -> Set[str]:
 
     print("Fetching from Netbox ... ", flush=True, end="")
 
-    await asyncio.gather(
-        *(nb_col_pc.fetch(hostname=hostname) for hostname in hostname_set)
-    )
+    if nb.client.graphql.enabled:
+        await fetch_collections(nb, hostname_set, portchans=nb_col_pc)
+    else:
+        await asyncio.gather(
+            *(nb_col_pc.fetch(hostname=hostname) for hostname in hostname_set)
+        )
 
     nb_col_pc.make_keys()
     print(f"{len(ipf_col_pc)} items.")
@@ -1,23 +1,63 @@
+from typing import Optional
+from collections import Counter
 from functools import wraps
-from ipf_netbox.source import get_source
+from ipf_netbox.session import Session, get_session
 from ipf_netbox.diff import DiffResults
 
 
 def with_sources(coro):
+    """
+    Call the task with the IP Fabric and Netbox sources of the active session.
+    If there is no active session, then the task is run in its own session.
+    """
+
     @wraps(coro)
     async def wrapper(*vargs, **kwargs):
-        nb_src = get_source("netbox")
-        ipf_src = get_source("ipfabric")
-
-        async with nb_src.client, ipf_src.client:
-            ipf_src.client.api.timeout = 120
-            nb_src.client.timeout = 120
+        if (session := get_session()) is not None:
+            return await _run_task(coro, session, *vargs, **kwargs)
 
-            return await coro(ipf_src, nb_src, *vargs, **kwargs)
+        async with Session() as session:
+            return await _run_task(coro, session, *vargs, **kwargs)
 
     return wrapper
 
 
+async def _run_task(coro, session: Session, *vargs, **kwargs):
+    nb_src = session.get_source("netbox")
+    ipf_src = session.get_source("ipfabric")
+
+    # the session clients may be used by more than one task, so report the
+    # client stats counted during this task.
+
+    stats_before = Counter(getattr(nb_src.client, "stats", None) or {})
+
+    try:
+        return await coro(ipf_src, nb_src, *vargs, **kwargs)
+    finally:
+        client_stats_report(nb_src, since=stats_before)
+
+
+def client_stats_report(source, since: Optional[Counter] = None):
+    """
+    print the API client stats, if any, collected during the task; that is
+    the stats counted after the `since` values, if given.
+    """
+    if (limiter := getattr(source.client, "limiter", None)) is not None:
+        print(
+            f"\n{source.name} API: concurrency settled at {int(limiter.limit)}"
+            f" (range {limiter.low}-{limiter.high})"
+        )
+
+    if not (stats := getattr(source.client, "stats", None)):
+        return
+
+    if since and not (stats := stats - since):
+        return
+
+    stats_list = ", ".join(f"{name} {value}" for name, value in sorted(stats.items()))
+    print(f"{source.name} API: {stats_list}")
+
+
 def diff_report_brief(diff_res: DiffResults):
     print("\nDiff Report")
     print(f"   Create Missing: count {len(diff_res.missing)}")
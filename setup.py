@@ -57,6 +57,11 @@ setup(
     packages=find_packages(),
     include_package_data=True,
     install_requires=requirements(),
+    extras_require={
+        "fast-json": ["orjson", "msgspec"],
+        "msgspec": ["msgspec"],
+        "http2": ["httpx[http2]"],
+    },
     entry_points={"console_scripts": ["ipf-netbox = ipf_netbox.cli.__main__:script"]},
     classifiers=[
         "Development Status :: 3 - Alpha",
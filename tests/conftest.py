@@ -0,0 +1,13 @@
+import os
+
+# the ipf_netbox package requires the source environment variables at import;
+# the tests use mock transports, so the values are not used.
+
+for _var, _value in (
+    ("IPF_ADDR", "http://ipfabric.test"),
+    ("IPF_USERNAME", "test"),
+    ("IPF_PASSWORD", "test"),
+    ("NETBOX_ADDR", "http://netbox.test"),
+    ("NETBOX_TOKEN", "test"),
+):
+    os.environ.setdefault(_var, _value)
@@ -0,0 +1,66 @@
+from typing import Callable, Dict, List, Optional
+
+import httpx
+
+
+class NetboxStub(object):
+    """
+    A Netbox REST API stand-in, for use with httpx.MockTransport, that serves
+    the GET list endpoints of the `tables` records.  It supports the limit,
+    offset, ordering (id or -id), id__gt and id__lte params, the device (name)
+    filter, and equality filters on top-level fields.  The `max_page_sz` is the server limit.
+    """
+
+    IGNORE_PARAMS = {"limit", "offset", "ordering", "brief", "fields"}
+
+    def __init__(self, tables: Dict[str, List[Dict]], max_page_sz: int = 1000):
+        self.tables = tables
+        self.max_page_sz = max_page_sz
+        self.requests: List[httpx.Request] = list()
+
+        # called with each request before it is served, for example to change
+        # the tables during a paginate.  The request is answered with the
+        # response returned, if any, for example to inject server errors.
+
+        self.on_request: Optional[
+            Callable[[httpx.Request], Optional[httpx.Response]]
+        ] = None
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if self.on_request and (res := self.on_request(request)) is not None:
+            return res
+
+        params = request.url.params
+        path = request.url.path[len("/api") :]
+
+        if path == "/":
+            return httpx.Response(200, json={}, headers={"API-Version": "3.7"})
+
+        records = list(self.tables[path])
+
+        for name, value in params.multi_items():
+            if name in self.IGNORE_PARAMS:
+                continue
+            if name == "id__gt":
+                records = [rec for rec in records if rec["id"] > int(value)]
+            elif name == "id__lte":
+                records = [rec for rec in records if rec["id"] <= int(value)]
+            elif name == "device":
+                values = params.get_list(name)
+                records = [rec for rec in records if rec["device"]["name"] in values]
+            else:
+                values = params.get_list(name)
+                records = [rec for rec in records if str(rec.get(name)) in values]
+
+        if (ordering := params.get("ordering")) in ("id", "-id"):
+            records.sort(key=lambda rec: rec["id"], reverse=ordering == "-id")
+
+        offset = int(params.get("offset", 0))
+        limit = min(int(params.get("limit", 50)), self.max_page_sz)
+
+        return httpx.Response(
+            200,
+            json=dict(count=len(records), results=records[offset : offset + limit]),
+            headers={"API-Version": "3.7"},
+        )
@@ -0,0 +1,14 @@
+from importlib.util import find_spec
+
+import pytest
+from pydantic import ValidationError
+
+from ipf_netbox.config_models import HttpModel
+
+
+@pytest.mark.skipif(find_spec("h2") is not None, reason="h2 is installed")
+def test_http2_requires_h2():
+    with pytest.raises(ValidationError, match="ipf-netbox\\[http2\\]"):
+        HttpModel(http2=True)
+
+    assert HttpModel(http2=False).http2 is False
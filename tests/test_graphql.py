@@ -0,0 +1,88 @@
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+
+from ipf_netbox.netbox.source import NetboxClient
+from ipf_netbox.netbox.graphql import fetch_collections
+from ipf_netbox.netbox.interfaces import NetboxInterfaceCollection
+from ipf_netbox.netbox.portchans import NetboxPortChanCollection
+
+
+def _device(dev_id, name):
+    lag = dict(id=dev_id * 10 + 1, name="Port-Channel1", description="", lag=None)
+    member = dict(id=dev_id * 10 + 2, name="Ethernet1", description="up", lag=None)
+    lag["type"], member["type"] = "LAG", "A_1000BASE_T"
+    member["lag"] = dict(id=lag["id"], name=lag["name"])
+    return dict(id=dev_id, name=name, interfaces=[lag, member])
+
+
+class GraphQLStub(object):
+    """a Netbox GraphQL endpoint for the device_list query"""
+
+    def __init__(self, devices):
+        self.devices = {rec["name"]: rec for rec in devices}
+        self.queries = list()
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/graphql/"
+        body = json.loads(request.content)
+        self.queries.append(body["query"])
+
+        with_interfaces = "interfaces" in body["query"]
+        dev_list = [
+            (
+                dict(self.devices[name], interfaces=[])
+                if not with_interfaces
+                else json.loads(json.dumps(self.devices[name]))
+            )
+            for name in body["variables"]["names"]
+            if name in self.devices
+        ]
+        return httpx.Response(200, json=dict(data=dict(device_list=dev_list)))
+
+
+def _fetch(stub, hostnames, **collections):
+    async def run():
+        async with NetboxClient(transport=httpx.MockTransport(stub.handler)) as client:
+            source = SimpleNamespace(client=client)
+            for name, col_cls in collections.items():
+                collections[name] = col_cls(source=source)
+            await fetch_collections(source, hostnames, **collections)
+        return collections
+
+    return asyncio.run(run())
+
+
+def test_graphql_empty_interfaces_collection():
+    stub = GraphQLStub([_device(1, "sw1"), _device(2, "sw2")])
+    cols = _fetch(stub, ["sw1", "sw2"], interfaces=NetboxInterfaceCollection)
+
+    assert all("interfaces" in query for query in stub.queries)
+    assert len(cols["interfaces"].source_records) == 4
+
+    if_rec = cols["interfaces"].source_records[0]
+    assert if_rec["type"] == "lag"
+    assert if_rec["device"] == dict(id=1, name="sw1")
+
+
+def test_graphql_empty_portchans_collection():
+    stub = GraphQLStub([_device(1, "sw1")])
+    cols = _fetch(stub, ["sw1"], portchans=NetboxPortChanCollection)
+    portchans = cols["portchans"]
+
+    assert all("interfaces" in query for query in stub.queries)
+    assert list(portchans.cache[portchans]["lag_recs"]) == [("sw1", "Port-Channel1")]
+    assert [rec["name"] for rec in portchans.source_records] == ["Ethernet1"]
+
+
+def test_graphql_batches():
+    names = [f"sw{dev_id}" for dev_id in range(120)]
+    stub = GraphQLStub([_device(dev_id, name) for dev_id, name in enumerate(names)])
+    cols = _fetch(stub, names, interfaces=NetboxInterfaceCollection)
+
+    # the default batch size is 50 devices per query.
+
+    assert len(stub.queries) == 3
+    assert len(cols["interfaces"].source_records) == 240
@@ -0,0 +1,33 @@
+import io
+import asyncio
+
+import toml
+
+from ipf_netbox.config import load_config_file
+from ipf_netbox.ipfabric.source import PooledIPFabricClient
+
+
+def test_session_uses_pool_options():
+    cfg = dict(
+        defaults=dict(domain_names=[]),
+        sources=dict(ipfabric=dict(http=dict(max_connections=7))),
+    )
+    load_config_file(io.StringIO(toml.dumps(cfg)))
+
+    async def run():
+        client = PooledIPFabricClient()
+        api = client.api
+        default = api._transport
+
+        await client._use_pool(api)
+        pooled = api._transport
+        await client._use_pool(api)
+
+        assert pooled is not default
+        assert api._transport is pooled
+        assert pooled._pool._max_connections == 7
+        assert default._pool.connections == []
+
+        await api.aclose()
+
+    asyncio.run(run())
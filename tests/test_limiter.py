@@ -0,0 +1,78 @@
+import asyncio
+
+from ipf_netbox.limiter import AIMDLimiter
+from ipf_netbox.netbox.source import NetboxClient
+
+
+def test_cancelled_woken_waiter_passes_slot():
+    async def run():
+        limiter = AIMDLimiter(initial=2, minimum=1)
+        tokens = [await limiter.acquire(), await limiter.acquire()]
+
+        first = asyncio.ensure_future(limiter.acquire())
+        second = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+
+        # free one slot, which wakes the first waiter, and cancel that waiter
+        # before it runs.
+
+        limiter.release(tokens.pop(), key="GET", ok=None)
+        first.cancel()
+
+        await asyncio.wait_for(second, 1)
+        return limiter
+
+    limiter = asyncio.run(run())
+    assert limiter.inflight == 2
+
+
+def test_limit_bounds_inflight():
+    async def run():
+        limiter = AIMDLimiter(initial=4, minimum=1, maximum=4)
+        peak = 0
+
+        async def _request():
+            nonlocal peak
+            token = await limiter.acquire()
+            peak = max(peak, limiter.inflight)
+            await asyncio.sleep(0.001)
+            limiter.release(token, key="GET", ok=True)
+
+        await asyncio.gather(*(_request() for _ in range(50)))
+        return limiter, peak
+
+    limiter, peak = asyncio.run(run())
+    assert peak <= 4
+    assert limiter.inflight == 0
+
+
+def test_latency_baseline_per_kind():
+    # a healthy server, where large pages take longer than record lookups,
+    # must not reduce the limit.
+
+    async def run():
+        limiter = AIMDLimiter(initial=20)
+        kinds = [(("GET", "/dcim/devices/", "1"), 0.005)] * 3
+        kinds += [(("GET", "/dcim/interfaces/", "1000"), 0.06)]
+
+        for _ in range(100):
+            for kind, latency in kinds:
+                started, epoch = await limiter.acquire()
+                limiter.release((started - latency, epoch), key=kind, ok=True)
+
+        return limiter
+
+    limiter = asyncio.run(run())
+    assert limiter.low == 20
+    assert limiter.limit > 20
+
+
+def test_latency_kind():
+    client = NetboxClient()
+    kind = client._latency_kind
+
+    assert kind("get", "/dcim/devices/12/", None) == ("GET", "/dcim/devices/", None)
+    assert kind("GET", "/dcim/devices/", {"limit": 1000}) != kind(
+        "GET", "/dcim/devices/", {"limit": 1}
+    )
+    assert kind("GET", "/", None) != kind("GET", "/dcim/devices/", None)
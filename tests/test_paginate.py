@@ -0,0 +1,119 @@
+import asyncio
+
+import httpx
+
+from ipf_netbox.config import RetryModel
+from ipf_netbox.netbox.source import NetboxClient
+
+from netbox_stub import NetboxStub
+
+URL = "/dcim/interfaces/"
+
+
+def _records(count):
+    return [dict(id=rec_id, name=f"Ethernet{rec_id}") for rec_id in range(1, count + 1)]
+
+
+def _paginate(stub, **kwargs):
+    async def run():
+        transport = httpx.MockTransport(stub.handler)
+        async with NetboxClient(transport=transport) as client:
+            client.retry = RetryModel(max_retries=0)
+            records = await asyncio.wait_for(client.paginate(URL, **kwargs), 5)
+            return client, records
+
+    return asyncio.run(run())
+
+
+def test_paginate_server_max_page_size():
+    stub = NetboxStub({URL: _records(2000)}, max_page_sz=250)
+    client, records = _paginate(stub, page_sz=500)
+
+    assert [rec["id"] for rec in records] == list(range(1, 2001))
+    assert client.max_page_sz == 250
+
+
+def test_paginate_table_shrinks():
+    table = _records(5000)
+    stub = NetboxStub({URL: table})
+
+    def _shrink(_request):
+        if len(stub.requests) == 3:
+            del table[len(table) // 2 :]
+
+    stub.on_request = _shrink
+    client, records = _paginate(stub, page_sz=100, prefetch=4)
+
+    assert len(stub.requests) < 100
+    assert client.max_page_sz == NetboxClient.MAX_PAGE_SIZE
+    assert {rec["id"] for rec in records} <= {rec_id for rec_id in range(1, 5001)}
+
+
+def test_paginate_short_page_after_delete():
+    # records deleted mid-walk leave a short page, which must not be taken as
+    # the server MAX_PAGE_SIZE.
+
+    table = _records(1000)
+    stub = NetboxStub({URL: table})
+
+    def _truncate(_request):
+        if len(stub.requests) == 2:
+            del table[103:]
+
+    stub.on_request = _truncate
+    client, records = _paginate(stub, page_sz=100, prefetch=1)
+
+    assert [rec["id"] for rec in records] == list(range(1, 104))
+    assert client.max_page_sz == NetboxClient.MAX_PAGE_SIZE
+
+
+def test_paginate_keyset_table_emptied():
+    table = _records(3000)
+    stub = NetboxStub({URL: table})
+
+    def _empty(_request):
+        if len(stub.requests) == 2:
+            table.clear()
+
+    stub.on_request = _empty
+    client, records = _paginate(stub, keyset=True)
+
+    assert [rec["id"] for rec in records] == list(range(1, 1001))
+    assert client.max_page_sz == NetboxClient.MAX_PAGE_SIZE
+
+
+def _large_page_failure(failure):
+    # the server fails any page of more than 500 records.
+
+    def _on_request(request):
+        if int(request.url.params.get("limit", 0)) > 500:
+            return failure(request)
+
+    return _on_request
+
+
+def _status_504(request):
+    return httpx.Response(504, request=request)
+
+
+def _timeout(request):
+    raise httpx.ReadTimeout("timeout", request=request)
+
+
+def test_paginate_split_on_5xx():
+    stub = NetboxStub({URL: _records(3000)}, max_page_sz=250)
+    stub.on_request = _large_page_failure(_status_504)
+    client, records = _paginate(stub, page_sz=1000)
+
+    assert [rec["id"] for rec in records] == list(range(1, 3001))
+    assert client.stats["page_splits"] > 0
+    assert client.max_page_sz == 250
+
+
+def test_paginate_split_on_timeout():
+    stub = NetboxStub({URL: _records(3000)})
+    stub.on_request = _large_page_failure(_timeout)
+    client, records = _paginate(stub, page_sz=1000)
+
+    assert [rec["id"] for rec in records] == list(range(1, 3001))
+    assert client.stats["page_splits"] > 0
@@ -0,0 +1,40 @@
+import json
+from typing import List
+
+import pytest
+
+from ipf_netbox.codec import projected_decoder
+from ipf_netbox.netbox.schemas import DeviceRecord, IPAddrRecord
+
+pytest.importorskip("msgspec")
+
+
+def test_ipaddr_unassigned():
+    if_ref = dict(id=3, name="Ethernet1", device=dict(id=1, name="sw1"))
+    records = [
+        dict(id=1, address="10.0.0.1/24", interface=if_ref, vrf=None),
+        dict(id=2, address="10.0.0.2/24", interface=None, vrf=None),
+    ]
+    decoded = projected_decoder(List[IPAddrRecord])(json.dumps(records))
+
+    assert decoded[0] == dict(id=1, address="10.0.0.1/24", interface=if_ref)
+    assert decoded[1]["interface"] is None
+
+
+def test_device_nullable_refs():
+    record = dict(
+        id=1,
+        name=None,
+        serial="",
+        status=dict(value="active", label="Active"),
+        site=dict(id=1, slug="atl"),
+        platform=None,
+        device_type=dict(id=1, slug="dcs-7050", manufacturer=dict(id=1, slug="arista")),
+        primary_ip=None,
+        last_updated=None,
+    )
+    decoded = projected_decoder(DeviceRecord)(json.dumps(record))
+
+    assert decoded["platform"] is None
+    assert decoded["primary_ip"] is None
+    assert decoded["status"] == dict(value="active")
@@ -0,0 +1,77 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+
+from ipf_netbox.netbox.source import NetboxClient
+from ipf_netbox.netbox.ipaddrs import NetboxIPAddrCollection
+from ipf_netbox.netbox.interfaces import NetboxInterfaceCollection
+
+from netbox_stub import NetboxStub
+
+
+def _ipaddr(rec_id, hostname):
+    interface = None
+    if hostname:
+        device = dict(id=rec_id, name=hostname)
+        interface = dict(id=rec_id, name="Ethernet1", device=device)
+    return dict(id=rec_id, address=f"10.0.0.{rec_id}/24", interface=interface)
+
+
+def test_full_table_unassigned_ipaddrs():
+    stub = NetboxStub(
+        {
+            "/dcim/sites/": [dict(id=1, slug="atl", device_count=3)],
+            "/ipam/ip-addresses/": [
+                _ipaddr(1, "sw1"),
+                _ipaddr(2, None),
+                _ipaddr(3, "sw2"),
+                _ipaddr(4, "sw3"),
+            ],
+        }
+    )
+
+    async def run():
+        async with NetboxClient(transport=httpx.MockTransport(stub.handler)) as client:
+            col = NetboxIPAddrCollection(source=SimpleNamespace(client=client))
+            strategy = await col.fetch_scope(dict(sw1="atl", sw2="atl"))
+        return col, strategy
+
+    col, strategy = asyncio.run(run())
+
+    assert strategy.startswith("full table")
+    assert sorted(rec["id"] for rec in col.source_records) == [1, 3]
+
+
+def _interface(rec_id, hostname, site):
+    device = dict(id=rec_id, name=hostname)
+    return dict(id=rec_id, name="Ethernet1", description="", device=device, site=site)
+
+
+def test_sites_device_in_other_netbox_site():
+    # sw2 is in the IPF "atl" site, but in the Netbox "bos" site.
+
+    stub = NetboxStub(
+        {
+            "/dcim/sites/": [
+                dict(id=1, slug="atl", device_count=2),
+                dict(id=2, slug="bos", device_count=10),
+            ],
+            "/dcim/interfaces/": [
+                _interface(1, "sw1", "atl"),
+                _interface(2, "sw2", "bos"),
+                _interface(3, "sw3", "bos"),
+            ],
+        }
+    )
+
+    async def run():
+        async with NetboxClient(transport=httpx.MockTransport(stub.handler)) as client:
+            col = NetboxInterfaceCollection(source=SimpleNamespace(client=client))
+            strategy = await col.fetch_scope(dict(sw1="atl", sw2="atl"))
+        return col, strategy
+
+    col, strategy = asyncio.run(run())
+
+    assert strategy == "1 sites, 1 devices in 1 queries"
+    assert sorted(rec["id"] for rec in col.source_records) == [1, 2]
@@ -0,0 +1,51 @@
+import asyncio
+
+import httpx
+
+from ipf_netbox.netbox.source import NetboxClient
+
+URL = "/dcim/devices/1/"
+
+
+def test_get_after_write_not_coalesced():
+    async def run():
+        device = dict(id=1, name="sw1")
+        release = asyncio.Event()
+        gets = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal gets
+            if request.method == "PATCH":
+                device["name"] = "sw1-new"
+                return httpx.Response(200, json=device)
+
+            gets += 1
+            body = dict(device)
+            if gets == 1:
+                await release.wait()
+            return httpx.Response(200, json=body)
+
+        async with NetboxClient(transport=httpx.MockTransport(handler)) as client:
+            before = asyncio.ensure_future(client.get(URL))
+            await asyncio.sleep(0.01)
+
+            # a GET issued while the first is in flight shares its response.
+
+            shared = asyncio.ensure_future(client.get(URL))
+            await asyncio.sleep(0.01)
+
+            # a GET issued after a write does not.
+
+            await client.patch(URL, json=dict(name="sw1-new"))
+            after = await asyncio.wait_for(client.get(URL), 1)
+
+            release.set()
+            results = await asyncio.gather(before, shared)
+
+        return [res.json()["name"] for res in results], after.json()["name"], gets
+
+    (before, shared), after, gets = asyncio.run(run())
+
+    assert before == shared == "sw1"
+    assert after == "sw1-new"
+    assert gets == 2